@@ -1,12 +1,32 @@
-﻿from pydantic_settings import BaseSettings, SettingsConfigDict
+﻿import hashlib
+import json
+import os
+from functools import cached_property, lru_cache
+from pathlib import Path
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 
+# Startup cache: validated settings dumped to JSON so subsequent processes
+# (CLI invocations, sandbox workers) skip .env parsing and per-field env
+# lookup. Invalidated by the env fingerprint below. Contains API keys and
+# bot tokens, so it lives under data/secrets/<service>/ per critical
+# rule #9 (SEC-1, gitignored), written with mode 0600. Anchored at the
+# repo root so processes started from another CWD share the same cache.
+_ROOT = Path(__file__).resolve().parents[1]
+_CACHE_PATH = _ROOT / "data" / "secrets" / "settings" / "cache.json"
+
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
         extra="ignore",
+        # Read-only singleton: frozen skips assignment validation, exact-case
+        # env keys skip case folding, defaults are trusted as-is.
+        frozen=True,
+        case_sensitive=True,
+        validate_default=False,
     )
 
     anthropic_api_key: str = Field(..., alias="ANTHROPIC_API_KEY")
@@ -25,6 +45,7 @@ class Settings(BaseSettings):
     telegram_bot_token: str = Field("", alias="TELEGRAM_BOT_TOKEN")
     telegram_allowed_users: str = Field("", alias="TELEGRAM_ALLOWED_USERS")
     telegram_channel_id: str = Field("", alias="TELEGRAM_CHANNEL_ID")
+    telegram_max_concurrent_tasks: int = Field(8, alias="TELEGRAM_MAX_CONCURRENT_TASKS")
     openai_api_key: str = Field("", alias="OPENAI_API_KEY")
     openai_base_url: str = Field("", alias="OPENAI_BASE_URL")
     tavily_api_key: str = Field("", alias="TAVILY_API_KEY")
@@ -44,12 +65,76 @@ class Settings(BaseSettings):
     timezone: str = Field("Asia/Vladivostok", alias="TIMEZONE")
     # Dev-only: enables code review agents and dev tools
     dev_mode: bool = Field(False, alias="DEV_MODE")
+    evaluator_skip_on_success: bool = Field(False, alias="EVALUATOR_SKIP_ON_SUCCESS")
+    plan_cache_enabled: bool = Field(True, alias="PLAN_CACHE_ENABLED")
+    # Opt-in: near-identical task goals (cosine >= 0.90) reuse a cached plan
+    plan_cache_semantic: bool = Field(False, alias="PLAN_CACHE_SEMANTIC")
+    # Dev-only: directory for the persistent cross-run LLM cache (empty = off)
+    llm_cache_dir: str = Field("", alias="ORGANISM_CACHE_DIR")
 
-    @property
-    def allowed_user_ids(self) -> list[int]:
+    @cached_property
+    def allowed_user_ids(self) -> frozenset[int]:
+        # Parsed once, cached on the instance; frozenset gives O(1) `id in allowed`.
         if not self.telegram_allowed_users:
-            return []
-        return [int(uid.strip()) for uid in self.telegram_allowed_users.split(",")]
+            return frozenset()
+        return frozenset(int(uid.strip()) for uid in self.telegram_allowed_users.split(","))
+
+
+def _env_fingerprint() -> str:
+    """Hash of the env slice (and .env file stat) that feeds Settings."""
+    aliases = sorted(f.alias for f in Settings.model_fields.values() if f.alias)
+    parts = [f"{a}={os.environ.get(a, '')}" for a in aliases]
+    try:
+        st = os.stat(".env")
+        parts.append(f".env:{st.st_mtime_ns}:{st.st_size}")
+    except OSError:
+        parts.append(".env:absent")
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    fingerprint = _env_fingerprint()
+    try:
+        cached = json.loads(_CACHE_PATH.read_text(encoding="utf-8"))
+        if cached.get("fingerprint") == fingerprint:
+            # model_validate skips the env/dotenv sources entirely —
+            # it reuses the already-compiled core schema
+            return Settings.model_validate(cached["settings"])
+    except Exception:
+        pass
+
+    settings = Settings()
+    try:
+        _CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        # Remove any cache left at the pre-SEC-1 location
+        (_ROOT / "data" / ".settings_cache.json").unlink(missing_ok=True)
+        payload = json.dumps({
+            "fingerprint": fingerprint,
+            "settings": json.loads(settings.model_dump_json(by_alias=True)),
+        })
+        fd = os.open(_CACHE_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(payload)
+    except Exception:
+        pass
+    return settings
+
+
+def warmup() -> None:
+    """Front-load pydantic-core and the settings singleton.
+
+    Long-lived entry points (Telegram bot, interactive CLI) call this before
+    starting the event loop so the first real request doesn't pay the Rust
+    core import plus env parsing as a latency spike.
+    """
+    import pydantic_core  # noqa: F401 — imported for its side effect
+    get_settings()
 
 
-settings = Settings()
+def __getattr__(name: str):
+    # PEP 562: lazy singleton — env parsing happens on first access,
+    # not on every `import config.settings` at startup.
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(name)
@@ -1,14 +1,23 @@
+from __future__ import annotations
+
 import asyncio
 import argparse
 import sys
+from typing import TYPE_CHECKING
 
-from src.organism.llm.claude import ClaudeProvider
-from src.organism.tools.registry import ToolRegistry
-from src.organism.tools.bootstrap import build_registry
-from src.organism.core.loop import CoreLoop
-from src.organism.memory.manager import MemoryManager
 from config.settings import settings
 
+if TYPE_CHECKING:
+    from src.organism.core.loop import CoreLoop
+    from src.organism.tools.registry import ToolRegistry
+
+# Heavy modules (anthropic, aiogram, pptx, pandas, ...) are imported inside
+# the run_* paths that actually need them — `--stats` / `--cache` / `--help`
+# should not pay the full tool/agent import cost.
+
+# O(1) membership + no lowercase copy of long pasted tasks (length-guarded)
+_EXIT_COMMANDS = frozenset({"exit", "quit", "q"})
+
 
 async def _connect_mcp(registry: ToolRegistry) -> None:
     """Connect pending MCP servers queued by build_registry()."""
@@ -28,8 +37,27 @@ def _load_personality():
     return p
 
 
+async def _bootstrap_orchestrator():
+    """Build the (orchestrator, memory) pair shared by the --multi paths."""
+    from src.organism.agents.orchestrator import Orchestrator
+    from src.organism.llm.claude import get_llm
+    from src.organism.memory.manager import MemoryManager
+    from src.organism.tools.bootstrap import build_registry
+    llm = get_llm()
+    registry = build_registry(personality=_load_personality())
+    await _connect_mcp(registry)
+    memory = MemoryManager() if settings.database_url else None
+    if memory:
+        await memory.initialize()
+    return Orchestrator(llm, registry, memory=memory), memory
+
+
 def build_loop(registry: ToolRegistry | None = None, personality=None, with_orchestrator: bool = False) -> CoreLoop:
-    llm = ClaudeProvider()
+    from src.organism.core.loop import CoreLoop
+    from src.organism.llm.claude import get_llm
+    from src.organism.memory.manager import MemoryManager
+    from src.organism.tools.bootstrap import build_registry
+    llm = get_llm()
     p = personality if personality is not None else _load_personality()
     reg = registry or build_registry(personality=p)
     memory = MemoryManager() if settings.database_url else None
@@ -59,6 +87,7 @@ def build_loop(registry: ToolRegistry | None = None, personality=None, with_orch
 
 
 async def run_single(task: str, use_orchestrator: bool = False) -> None:
+    from src.organism.memory.manager import MemoryManager
     from src.organism.commands.handler import CommandHandler
     handler = CommandHandler()
     if handler.is_command(task):
@@ -76,15 +105,7 @@ async def run_single(task: str, use_orchestrator: bool = False) -> None:
         return
 
     if use_orchestrator:
-        from src.organism.agents.orchestrator import Orchestrator
-        llm = ClaudeProvider()
-        _p = _load_personality()
-        registry = build_registry(personality=_p)
-        await _connect_mcp(registry)
-        memory = MemoryManager() if settings.database_url else None
-        if memory:
-            await memory.initialize()
-        orch = Orchestrator(llm, registry, memory=memory)
+        orch, _memory = await _bootstrap_orchestrator()
         result = await orch.run(task)
     else:
         loop = build_loop()
@@ -105,19 +126,13 @@ async def run_single(task: str, use_orchestrator: bool = False) -> None:
 
 
 async def run_interactive(use_orchestrator: bool = False) -> None:
+    from config.settings import warmup
     from src.organism.channels.gateway import Gateway
     from src.organism.channels.cli_channel import CLIChannel
+    warmup()
 
     if use_orchestrator:
-        from src.organism.agents.orchestrator import Orchestrator
-        llm = ClaudeProvider()
-        _p = _load_personality()
-        registry = build_registry(personality=_p)
-        await _connect_mcp(registry)
-        memory = MemoryManager() if settings.database_url else None
-        if memory:
-            await memory.initialize()
-        orch = Orchestrator(llm, registry, memory=memory)
+        orch, memory = await _bootstrap_orchestrator()
         # Orchestrator mode — still direct (no Gateway wrapper yet)
         from src.organism.commands.handler import CommandHandler
         handler = CommandHandler()
@@ -130,7 +145,7 @@ async def run_interactive(use_orchestrator: bool = False) -> None:
                 break
             if not task:
                 continue
-            if task.lower() in ("exit", "quit", "q"):
+            if len(task) <= 4 and task.lower() in _EXIT_COMMANDS:
                 print("Bye.")
                 break
             if handler.is_command(task):
@@ -172,6 +187,9 @@ async def run_telegram() -> None:
     from src.organism.core.scheduler import ProactiveScheduler
     from src.organism.core.human_approval import HumanApproval
     from src.organism.tools.confirm_user import ConfirmUserTool
+    from src.organism.tools.bootstrap import build_registry
+    from config.settings import warmup
+    warmup()
     if not settings.telegram_bot_token:
         print("Error: TELEGRAM_BOT_TOKEN not set in .env")
         sys.exit(1)
@@ -281,6 +299,7 @@ async def run_telegram() -> None:
 
 
 async def run_stats() -> None:
+    from src.organism.memory.manager import MemoryManager
     memory = MemoryManager()
     await memory.initialize()
     stats = await memory.get_stats()
@@ -292,7 +311,8 @@ async def run_stats() -> None:
 
 async def run_analyze() -> None:
     from src.organism.self_improvement.optimizer import PromptOptimizer
-    llm = ClaudeProvider()
+    from src.organism.llm.claude import get_llm
+    llm = get_llm()
     optimizer = PromptOptimizer(llm)
     print("Analyzing performance...\n")
     recommendations = await optimizer.analyze_and_recommend()
@@ -302,10 +322,12 @@ async def run_analyze() -> None:
 async def run_improve(days: int = 7) -> None:
     from src.organism.self_improvement.auto_improver import AutoImprover
     from src.organism.memory.knowledge_base import KnowledgeBase
+    from src.organism.llm.claude import get_llm
+    from src.organism.memory.manager import MemoryManager
     if not settings.database_url:
         print("Error: DATABASE_URL not configured")
         return
-    llm = ClaudeProvider()
+    llm = get_llm()
     memory = MemoryManager()
     await memory.initialize()
     kb = KnowledgeBase()
@@ -324,8 +346,9 @@ async def run_improve(days: int = 7) -> None:
 async def run_optimize_prompts() -> None:
     from src.organism.self_improvement.prompt_versioning import PromptVersionControl
     from src.organism.self_improvement.benchmark_optimizer import BenchmarkPromptOptimizer
+    from src.organism.llm.claude import get_llm
 
-    llm = ClaudeProvider()
+    llm = get_llm()
     pvc = PromptVersionControl()
     optimizer = BenchmarkPromptOptimizer(llm, pvc)
 
@@ -349,8 +372,9 @@ async def run_optimize_prompts() -> None:
 async def run_evolve_prompts() -> None:
     from src.organism.self_improvement.prompt_versioning import PromptVersionControl
     from src.organism.self_improvement.evolutionary_search import EvolutionaryPromptSearch
+    from src.organism.llm.claude import get_llm
 
-    llm = ClaudeProvider()
+    llm = get_llm()
     pvc = PromptVersionControl()
     evo = EvolutionaryPromptSearch(llm, pvc)
 
@@ -385,6 +409,10 @@ async def run_cache_stats() -> None:
 async def run_mcp_server(port: int) -> None:
     import aiohttp.web
     from src.organism.mcp_serve.server import create_organism_app
+    from src.organism.core.loop import CoreLoop
+    from src.organism.llm.claude import get_llm
+    from src.organism.memory.manager import MemoryManager
+    from src.organism.tools.bootstrap import build_registry
 
     _p = _load_personality()
     registry = build_registry(personality=_p)
@@ -399,7 +427,7 @@ async def run_mcp_server(port: int) -> None:
             print("  [warn] Database unavailable \u2014 running without memory")
 
     personality = _load_personality()
-    llm = ClaudeProvider()
+    llm = get_llm()
     loop = CoreLoop(llm, registry, memory=memory, personality=personality)
 
     app = create_organism_app(loop, memory, registry)
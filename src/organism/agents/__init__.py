@@ -0,0 +1,30 @@
+"""Lazy re-exports (PEP 562).
+
+Importing `src.organism.agents` no longer pulls in every agent module —
+each one drags CoreLoop and its transitive imports, which matters for
+entry points that only need the orchestrator or a single agent.
+"""
+import importlib
+
+_LAZY = {
+    "BaseAgent": "src.organism.agents.base",
+    "AgentResult": "src.organism.agents.base",
+    "CoderAgent": "src.organism.agents.coder",
+    "ResearcherAgent": "src.organism.agents.researcher",
+    "WriterAgent": "src.organism.agents.writer",
+    "AnalystAgent": "src.organism.agents.analyst",
+    "Orchestrator": "src.organism.agents.orchestrator",
+    "OrchestratorResult": "src.organism.agents.orchestrator",
+    "MetaOrchestrator": "src.organism.agents.meta_orchestrator",
+    "AgentFactory": "src.organism.agents.factory",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(name) from None
+    return getattr(importlib.import_module(module), name)
@@ -1,6 +1,5 @@
 import time
-from .base import BaseAgent, AgentResult, TemperatureLocked
-from src.organism.core.loop import CoreLoop
+from .base import BaseAgent, AgentResult
 
 
 class AnalystAgent(BaseAgent):
@@ -28,19 +27,9 @@ class AnalystAgent(BaseAgent):
             "Never compute numbers mentally. Use pandas/numpy for analysis. "
             "Print all results with clear labels and units."
         )
-        llm = TemperatureLocked(self.llm, self.temperature)
-        loop = CoreLoop(llm, self.registry)
-        loop_result = await loop.run(enriched, verbose=False, skip_orchestrator=True)
+        loop_result = await self.loop.run(enriched, verbose=False, skip_orchestrator=True)
         return AgentResult(
             agent=self.name, task=task,
             output=loop_result.output, success=loop_result.success,
-            duration=time.time() - start, error=loop_result.error,
+            duration=time.perf_counter() - start, error=loop_result.error,
         )
-
-    async def run(self, task: str) -> AgentResult:
-        start = time.time()
-        # Q-7.5: cross-agent knowledge sharing
-        effective_task = await self._enrich_with_cross_insights(task)
-        result = await self._run_impl(effective_task, start)
-        await self._save_reflection(task, result)
-        return result
@@ -1,5 +1,6 @@
 import json
 import re
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
@@ -9,12 +10,13 @@ from src.organism.tools.registry import ToolRegistry
 from src.organism.logging.error_handler import get_logger
 
 if TYPE_CHECKING:
+    from src.organism.core.loop import CoreLoop
     from src.organism.memory.manager import MemoryManager
 
 _log = get_logger("agent.base")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentResult:
     agent: str
     task: str
@@ -39,6 +41,7 @@ class BaseAgent(ABC):
         self.llm = llm
         self.registry = registry
         self.memory = memory
+        self._loop: "CoreLoop | None" = None
 
     @property
     @abstractmethod
@@ -55,9 +58,32 @@ class BaseAgent(ABC):
     def tools(self) -> list[str]:
         """Tool names this agent uses."""
 
-    @abstractmethod
+    @property
+    def loop(self) -> "CoreLoop":
+        """CoreLoop shared across run() calls — construction wires evaluator,
+        validator, logger and skill matcher, so don't repeat it per task."""
+        if self._loop is None:
+            from src.organism.core.loop import CoreLoop
+            self._loop = CoreLoop(
+                TemperatureLocked(self.llm, self.temperature), self.registry
+            )
+            self._loop.MAX_RETRIES = self.max_iterations
+        return self._loop
+
     async def run(self, task: str) -> AgentResult:
-        """Execute a task."""
+        """Template: time once, enrich with cross-agent insights (Q-7.5),
+        delegate to _run_impl, reflect. Subclasses with extra pre-work
+        (e.g. coder's snippet cache) may still override."""
+        start = time.perf_counter()
+        effective_task = await self._enrich_with_cross_insights(task)
+        result = await self._run_impl(effective_task, start)
+        _log.debug(f"[{self.name}] took {result.duration:.3f}s")
+        await self._save_reflection(task, result)
+        return result
+
+    @abstractmethod
+    async def _run_impl(self, task: str, start: float) -> AgentResult:
+        """Execute a task. `start` is the perf_counter mark taken by run()."""
 
     async def _reflect(self, task: str, result: AgentResult) -> dict | None:
         """Call Haiku for structured self-evaluation (Q-7.1).
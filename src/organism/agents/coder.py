@@ -1,7 +1,6 @@
 import hashlib
 import time
-from .base import BaseAgent, AgentResult, TemperatureLocked
-from src.organism.core.loop import CoreLoop
+from .base import BaseAgent, AgentResult
 
 
 class CoderAgent(BaseAgent):
@@ -28,32 +27,27 @@ class CoderAgent(BaseAgent):
         return hashlib.sha256(task.strip().lower().encode()).hexdigest()[:16]
 
     async def run(self, task: str) -> AgentResult:
-        start = time.time()
-
+        # Snippet-cache fast path keyed on the raw task — on a hit we skip
+        # enrichment and reflection entirely
         key = self._cache_key(task)
         if key in self._snippet_cache:
             return AgentResult(
                 agent=self.name, task=task,
                 output=self._snippet_cache[key],
-                success=True, duration=time.time() - start,
+                success=True, duration=0.0,
             )
 
-        # Q-7.5: cross-agent knowledge sharing
-        effective_task = await self._enrich_with_cross_insights(task)
-
-        llm = TemperatureLocked(self.llm, self.temperature)
-        loop = CoreLoop(llm, self.registry)
-        loop.MAX_RETRIES = self.max_iterations
-        loop_result = await loop.run(effective_task, verbose=False, skip_orchestrator=True)
-
-        result = AgentResult(
-            agent=self.name, task=task,
-            output=loop_result.output, success=loop_result.success,
-            duration=time.time() - start, error=loop_result.error,
-        )
+        result = await super().run(task)
 
         if result.success:
             self._snippet_cache[key] = result.output
 
-        await self._save_reflection(task, result)
         return result
+
+    async def _run_impl(self, task: str, start: float) -> AgentResult:
+        loop_result = await self.loop.run(task, verbose=False, skip_orchestrator=True)
+        return AgentResult(
+            agent=self.name, task=task,
+            output=loop_result.output, success=loop_result.success,
+            duration=time.perf_counter() - start, error=loop_result.error,
+        )
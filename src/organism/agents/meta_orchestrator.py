@@ -116,7 +116,7 @@ class MetaOrchestrator:
             )
 
         self._current_depth += 1
-        start = time.time()
+        start = time.perf_counter()
         try:
             # Load personality file
             personality_content = ""
@@ -155,7 +155,7 @@ class MetaOrchestrator:
                     task=task,
                     success=result.success,
                     output=result.output,
-                    duration=time.time() - start,
+                    duration=time.perf_counter() - start,
                     error=result.error,
                 )
 
@@ -169,7 +169,7 @@ class MetaOrchestrator:
                 task=task,
                 success=False,
                 output="",
-                duration=time.time() - start,
+                duration=time.perf_counter() - start,
                 error=str(exc),
             )
         finally:
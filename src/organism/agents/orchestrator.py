@@ -8,16 +8,27 @@ The StateMachine graph replaces the old sequential loop:
 
 Falls back to the legacy sequential method on any StateMachine-level error.
 """
-import json
+import asyncio
+import importlib
 import re
+import sys
 import time
+from collections import deque
 from dataclasses import dataclass, field
+from types import MappingProxyType
+
+try:
+    # orjson parses routing JSON 2-5x faster; optional — stdlib fallback below
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Keep only the most recent agent summaries in the rolling context — it is
+# re-injected into every subsequent agent prompt, so unbounded growth costs
+# both O(N^2) copying and LLM tokens.
+_CONTEXT_MAX_CHUNKS = 8
 
 from src.organism.agents.base import BaseAgent, AgentResult
-from src.organism.agents.coder import CoderAgent
-from src.organism.agents.researcher import ResearcherAgent
-from src.organism.agents.writer import WriterAgent
-from src.organism.agents.analyst import AnalystAgent
 from src.organism.core.state_machine import StateMachine, WorkflowState
 from src.organism.llm.base import LLMProvider, Message
 from src.organism.tools.registry import ToolRegistry
@@ -26,9 +37,24 @@ from src.organism.logging.error_handler import get_logger, log_exception
 
 _log = get_logger("orchestrator")
 
+# Pre-compiled routing-JSON extractors — these run on every routing decision
+_JSON_ARRAY_RE = re.compile(r"\[[\s\S]*\]")
+_JSON_OBJECT_RE = re.compile(r"\{[\s\S]*\}")
+
+# Agent modules are imported lazily on first dispatch — a task routed to a
+# single agent shouldn't pay the import cost of the other three.
+_AGENT_MODULES = MappingProxyType({
+    "coder":      ("src.organism.agents.coder", "CoderAgent"),
+    "researcher": ("src.organism.agents.researcher", "ResearcherAgent"),
+    "writer":     ("src.organism.agents.writer", "WriterAgent"),
+    "analyst":    ("src.organism.agents.analyst", "AnalystAgent"),
+})
+
 # ── Prompts ──────────────────────────────────────────────────────────────────
 
-ORCHESTRATOR_SYSTEM = """You are an orchestrator that delegates tasks to specialized agents.
+# Interned: one canonical string object per process, so identity-keyed
+# caches (LLM prompt cache layers) can hit without comparing contents.
+ORCHESTRATOR_SYSTEM = sys.intern("""You are an orchestrator that delegates tasks to specialized agents.
 
 Available agents:
 - "coder": writes and runs Python code, algorithms, scripts, data processing
@@ -42,20 +68,22 @@ Given a user task, decide:
 
 Respond with ONLY a JSON array:
 [
-  {"agent": "researcher", "task": "specific sub-task for this agent"},
-  {"agent": "writer", "task": "specific sub-task using researcher results"}
+  {"agent": "researcher", "task": "specific sub-task for this agent", "depends_on": []},
+  {"agent": "writer", "task": "specific sub-task using researcher results", "depends_on": [0]}
 ]
 
 Rules:
 - Use the MINIMUM number of agents needed
 - If one agent can do it  use one
 - For sequential tasks where result of one feeds another  list in order
+- "depends_on" = zero-based indices of sub-tasks whose results this one needs;
+  use [] for sub-tasks that can run independently
 - Be specific in sub-task descriptions
-"""
+""")
 
 # Classify prompt: return the *first* agent to invoke + full delegation plan.
 # unicode: \u0417\u0430\u0434\u0430\u0447\u0430 = "\u0417\u0430\u0434\u0430\u0447\u0430" (task in Russian)
-_CLASSIFY_SYSTEM = (
+_CLASSIFY_SYSTEM = sys.intern(
     "You classify tasks for a multi-agent system.\n"
     "Available agents: researcher, writer, coder, analyst.\n"
     "Return JSON: {\"first_agent\": \"<name>\", \"plan\": [{\"agent\": \"<name>\", \"task\": \"<subtask>\"}]}\n"
@@ -67,7 +95,7 @@ _CLASSIFY_SYSTEM = (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class OrchestratorResult:
     task: str
     success: bool
@@ -87,17 +115,23 @@ class Orchestrator:
     ) -> None:
         self.llm = llm
         self.memory = memory
-        self._agents: dict[str, BaseAgent] = {
-            "coder":      CoderAgent(llm, registry, memory),
-            "researcher": ResearcherAgent(llm, registry, memory),
-            "writer":     WriterAgent(llm, registry, memory),
-            "analyst":    AnalystAgent(llm, registry, memory),
-        }
+        self._registry = registry
+        self._agent_cache: dict[str, BaseAgent] = {}
+
+    def _get_agent(self, name: str) -> BaseAgent | None:
+        """Instantiate (and cache) the named agent on first use."""
+        agent = self._agent_cache.get(name)
+        if agent is None and name in _AGENT_MODULES:
+            module_path, cls_name = _AGENT_MODULES[name]
+            cls = getattr(importlib.import_module(module_path), cls_name)
+            agent = cls(self.llm, self._registry, self.memory)
+            self._agent_cache[name] = agent
+        return agent
 
     # ── Public API (unchanged signature) ─────────────────────────────────────
 
     async def run(self, task: str, verbose: bool = True) -> OrchestratorResult:
-        start = time.time()
+        start = time.perf_counter()
 
         if verbose:
             print(f"\n{'='*50}")
@@ -123,17 +157,17 @@ class Orchestrator:
                 print("  [WARN] StateMachine error -- falling back to legacy orchestrator")
             result = await self._legacy_run(task, verbose)
 
-        duration = time.time() - start
+        duration = time.perf_counter() - start
         result.duration = duration
 
         # Save to memory
         if self.memory and result.success:
-            tools_used = list({
-                t
-                for a in result.agent_results
-                for t in self._agents.get(a.agent, CoderAgent(None, None)).tools
-                if self._agents.get(a.agent)
-            })
+            tool_set: set[str] = set()
+            for name in {a.agent for a in result.agent_results}:
+                agent_obj = self._get_agent(name)
+                if agent_obj:
+                    tool_set.update(agent_obj.tools)
+            tools_used = list(tool_set)
             try:
                 await self.memory.on_task_end(
                     task, result.output, result.success, duration,
@@ -156,7 +190,7 @@ class Orchestrator:
 
         # Shared mutable state for closures
         agent_results: list[AgentResult] = []
-        context_parts: list[str] = []
+        context_parts: deque[str] = deque(maxlen=_CONTEXT_MAX_CHUNKS)
         retry_count = 0
 
         # --- Node handlers -----------------------------------------------
@@ -178,23 +212,24 @@ class Orchestrator:
                     max_tokens=300,
                 )
                 text = resp.content.strip()
-                match = re.search(r"\{[\s\S]*\}", text)
+                match = _JSON_OBJECT_RE.search(text)
                 if match:
-                    data = json.loads(match.group(0))
+                    data = _json_loads(match.group(0))
                 else:
-                    data = json.loads(text)
+                    data = _json_loads(text)
 
                 plan = data.get("plan", [])
-                first = data.get("first_agent", "")
+                first = str(data.get("first_agent", "")).strip().lower()
 
-                # Validate plan entries have valid agent names
-                plan = [
-                    p for p in plan
-                    if isinstance(p, dict) and p.get("agent") in self._agents
-                ]
+                # Normalize once at parse time, then validate agent names
+                plan = [p for p in plan if isinstance(p, dict)]
+                for p in plan:
+                    if isinstance(p.get("agent"), str):
+                        p["agent"] = p["agent"].strip().lower()
+                plan = [p for p in plan if p.get("agent") in _AGENT_MODULES]
 
                 # If first_agent is valid but plan is empty, build plan from first
-                if first in self._agents and not plan:
+                if first in _AGENT_MODULES and not plan:
                     plan = [{"agent": first, "task": task}]
             except Exception:
                 plan = []
@@ -211,11 +246,12 @@ class Orchestrator:
                 plan = [{"agent": "researcher", "task": task}]
                 first = "researcher"
 
-            if not first or first not in self._agents:
+            if not first or first not in _AGENT_MODULES:
                 first = plan[0]["agent"]
 
             state.context["plan"] = plan
-            state.context["plan_index"] = 0
+            state.context["levels"] = self._dependency_levels(plan)
+            state.context["level_index"] = 0
 
             if verbose:
                 for d in plan:
@@ -223,15 +259,8 @@ class Orchestrator:
 
             return plan, first
 
-        async def agent_handler(state: WorkflowState) -> tuple[AgentResult, str]:
-            """Execute the current agent in the plan sequence."""
-            plan = state.context.get("plan", [])
-            idx = state.context.get("plan_index", 0)
-
-            if idx >= len(plan):
-                return AgentResult(agent="none", task=task, output="", success=False, duration=0, error="No more agents"), "done"
-
-            step = plan[idx]
+        async def run_one(step: dict) -> AgentResult:
+            """Run a single delegation entry with context + cross-agent insights."""
             agent_name = step["agent"]
             agent_task = step.get("task", task)
 
@@ -242,16 +271,13 @@ class Orchestrator:
             if verbose:
                 print(f"\n[{agent_name.upper()}] {step.get('task', task)[:60]}...")
 
-            agent = self._agents.get(agent_name)
+            agent = self._get_agent(agent_name)
             if not agent:
-                result = AgentResult(
+                return AgentResult(
                     agent=agent_name, task=agent_task, output="",
                     success=False, duration=0,
                     error=f"Unknown agent: {agent_name}",
                 )
-                agent_results.append(result)
-                state.context["plan_index"] = idx + 1
-                return result, self._next_condition(plan, idx)
 
             # Q-7.5: Cross-agent insights for this specific agent
             if self.memory:
@@ -266,24 +292,42 @@ class Orchestrator:
                 except Exception:
                     pass
 
-            result = await agent.run(agent_task)
-            agent_results.append(result)
+            return await agent.run(agent_task)
 
-            if verbose:
-                status = "OK" if result.success else "FAIL"
-                print(f"  [{status}] {result.duration:.1f}s | {result.output[:100]}")
+        async def agent_handler(state: WorkflowState) -> tuple[AgentResult, str]:
+            """Execute the next level of independent agents in the plan."""
+            levels = state.context.get("levels", [])
+            idx = state.context.get("level_index", 0)
+
+            if idx >= len(levels):
+                return AgentResult(agent="none", task=task, output="", success=False, duration=0, error="No more agents"), "done"
 
-            if result.success:
-                summary = await self._summarize_context(result.output, agent_name)
-                context_parts.append(f"\n[{agent_name}] result:\n{summary}\n")
-            elif verbose:
-                print(f"  Error: {result.error[:100]}")
+            level = levels[idx]
+            if len(level) == 1:
+                results = [await run_one(level[0])]
+            else:
+                # Independent sub-tasks — overlap their I/O-bound LLM/tool calls
+                results = list(await asyncio.gather(*[run_one(s) for s in level]))
 
-            state.context["plan_index"] = idx + 1
-            state.context["last_agent"] = agent_name
+            for step, result in zip(level, results):
+                agent_results.append(result)
+                # Slice the long output once per result; reuse for print + summary fallback
+                head = result.output[:800]
+                if verbose:
+                    status = "OK" if result.success else "FAIL"
+                    print(f"  [{status}] {result.duration:.1f}s | {head[:100]}")
+                if result.success:
+                    summary = await self._summarize_context(result.output, step["agent"], fallback=head)
+                    context_parts.append(f"\n[{step['agent']}] result:\n{summary}\n")
+                elif verbose:
+                    print(f"  Error: {result.error[:100]}")
+
+            result = results[-1]
+            state.context["level_index"] = idx + 1
+            state.context["last_agent"] = level[-1]["agent"]
             state.context["last_quality"] = getattr(result, "quality_score", 0.75 if result.success else 0.0)
 
-            return result, self._next_condition(plan, idx)
+            return result, self._next_condition(levels, idx)
 
         async def evaluate_handler(state: WorkflowState) -> tuple[str, str]:
             """Check quality of accumulated results; decide retry or done."""
@@ -300,15 +344,14 @@ class Orchestrator:
             if quality >= 0.7 or retry_count >= 1:
                 return f"quality={quality:.2f}", "done"
 
-            # Retry: re-run the last agent
+            # Retry: re-run the last agent level
             retry_count += 1
             last = state.context.get("last_agent", "")
-            plan = state.context.get("plan", [])
-            # Reset plan_index to re-run last agent
-            idx = state.context.get("plan_index", 1) - 1
+            # Reset level_index to re-run the last level
+            idx = state.context.get("level_index", 1) - 1
             if idx < 0:
                 idx = 0
-            state.context["plan_index"] = idx
+            state.context["level_index"] = idx
             if verbose:
                 print(f"  [EVAL] Retrying {last} (attempt {retry_count + 1})")
 
@@ -367,12 +410,33 @@ class Orchestrator:
             agent_results=agent_results,
         )
 
-    def _next_condition(self, plan: list[dict], current_idx: int) -> str:
+    def _next_condition(self, levels: list, current_idx: int) -> str:
         """Determine the transition condition after an agent step."""
-        if current_idx + 1 < len(plan):
+        if current_idx + 1 < len(levels):
             return "next_agent"
         return "evaluate"
 
+    def _dependency_levels(self, plan: list[dict]) -> list[list[dict]]:
+        """Group delegation entries into sequential levels of independent steps.
+
+        Entries may carry "depends_on": [indices]. Entries without the field
+        keep the old semantics — an implicit dependency on the previous entry —
+        so plans from older prompts still run strictly in order.
+        """
+        levels: list[list[dict]] = []
+        placed: dict[int, int] = {}  # entry index -> level index
+        for i, entry in enumerate(plan):
+            deps = entry.get("depends_on") if isinstance(entry, dict) else None
+            if not isinstance(deps, list):
+                deps = [i - 1] if i > 0 else []
+            dep_levels = [placed[d] for d in deps if isinstance(d, int) and d in placed]
+            level = max(dep_levels) + 1 if dep_levels else 0
+            while level >= len(levels):
+                levels.append([])
+            levels[level].append(entry)
+            placed[i] = level
+        return [lv for lv in levels if lv]
+
     # ── Legacy sequential method (fallback) ──────────────────────────────────
 
     async def _legacy_run(self, task: str, verbose: bool) -> OrchestratorResult:
@@ -393,26 +457,25 @@ class Orchestrator:
                 print(f"   [{d['agent']}] {d['task'][:80]}")
 
         agent_results: list[AgentResult] = []
-        context = ""
+        context_parts: deque[str] = deque(maxlen=_CONTEXT_MAX_CHUNKS)
 
-        for d in delegation:
+        async def run_one(d: dict) -> AgentResult:
             agent_name = d["agent"]
             agent_task = d["task"]
 
-            if context:
-                agent_task = f"{agent_task}\n\nContext from previous steps:\n{context}"
+            if context_parts:
+                agent_task = f"{agent_task}\n\nContext from previous steps:\n{''.join(context_parts)}"
 
             if verbose:
                 print(f"\n[{agent_name.upper()}] {d['task'][:60]}...")
 
-            agent = self._agents.get(agent_name)
+            agent = self._get_agent(agent_name)
             if not agent:
-                agent_results.append(AgentResult(
+                return AgentResult(
                     agent=agent_name, task=agent_task,
                     output="", success=False, duration=0,
                     error=f"Unknown agent: {agent_name}",
-                ))
-                continue
+                )
 
             # Q-7.5: Cross-agent insights
             if self.memory:
@@ -425,31 +488,46 @@ class Orchestrator:
                 except Exception:
                     pass
 
-            result = await agent.run(agent_task)
-            agent_results.append(result)
+            return await agent.run(agent_task)
 
-            if verbose:
-                status = "OK" if result.success else "FAIL"
-                print(f"  [{status}] {result.duration:.1f}s | {result.output[:100]}")
+        for level in self._dependency_levels(delegation):
+            if len(level) == 1:
+                results = [await run_one(level[0])]
+            else:
+                results = list(await asyncio.gather(*[run_one(d) for d in level]))
+
+            for d, result in zip(level, results):
+                agent_results.append(result)
 
-            if result.success:
-                summary = await self._summarize_context(result.output, agent_name)
-                context += f"\n[{agent_name}] result:\n{summary}\n"
-            elif verbose:
-                print(f"  Error: {result.error[:100]}")
+                head = result.output[:800]
+                if verbose:
+                    status = "OK" if result.success else "FAIL"
+                    print(f"  [{status}] {result.duration:.1f}s | {head[:100]}")
+
+                if result.success:
+                    summary = await self._summarize_context(result.output, d["agent"], fallback=head)
+                    context_parts.append(f"\n[{d['agent']}] result:\n{summary}\n")
+                elif verbose:
+                    print(f"  Error: {result.error[:100]}")
 
         successful = [r for r in agent_results if r.success]
         return OrchestratorResult(
             task=task,
             success=len(successful) > 0,
-            output=context.strip(),
+            output="".join(context_parts).strip(),
             agent_results=agent_results,
         )
 
     # ── Shared helpers ───────────────────────────────────────────────────────
 
-    async def _summarize_context(self, output: str, agent_name: str) -> str:
-        """Summarize agent output via Haiku (~100 tokens). Falls back to truncated raw output."""
+    async def _summarize_context(self, output: str, agent_name: str, fallback: str = "") -> str:
+        """Summarize agent output via Haiku (~100 tokens). Falls back to truncated raw output.
+
+        Callers that already hold a truncated head may pass it as `fallback`
+        to avoid re-slicing the same prefix.
+        """
+        if not fallback:
+            fallback = output[:800]
         try:
             resp = await self.llm.complete(
                 messages=[Message(role="user", content=output[:3000])],
@@ -463,9 +541,9 @@ class Orchestrator:
                 max_tokens=150,
             )
             summary = resp.content.strip()
-            return summary if summary else output[:800]
+            return summary if summary else fallback
         except Exception:
-            return output[:800]
+            return fallback
 
     async def _route(self, task: str) -> list[dict]:
         response = await self.llm.complete(
@@ -475,11 +553,21 @@ class Orchestrator:
         )
         text = response.content.strip()
 
-        match = re.search(r"\[[\s\S]*\]", text)
+        match = _JSON_ARRAY_RE.search(text)
         if match:
-            return json.loads(match.group(0))
+            return self._normalize_delegation(_json_loads(match.group(0)))
 
         if text.startswith("["):
-            return json.loads(text)
+            return self._normalize_delegation(_json_loads(text))
 
         raise ValueError(f"Could not parse routing response: {text[:200]}")
+
+    @staticmethod
+    def _normalize_delegation(delegation: list) -> list[dict]:
+        """Lowercase agent names once at parse time so lookups never miss
+        on LLM capitalization quirks."""
+        entries = [d for d in delegation if isinstance(d, dict)]
+        for d in entries:
+            if isinstance(d.get("agent"), str):
+                d["agent"] = d["agent"].strip().lower()
+        return entries
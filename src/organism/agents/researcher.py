@@ -1,7 +1,6 @@
 import asyncio
 import time
-from .base import BaseAgent, AgentResult, TemperatureLocked
-from src.organism.core.loop import CoreLoop
+from .base import BaseAgent, AgentResult
 from src.organism.llm.base import Message
 
 
@@ -61,29 +60,18 @@ class ResearcherAgent(BaseAgent):
         return "\n".join(combined) if combined else None
 
     async def _run_impl(self, task: str, start: float) -> AgentResult:
-        llm = TemperatureLocked(self.llm, self.temperature)
         search_context = await self._parallel_search(task)
         if search_context:
             enriched = (
                 f"{task}\n\n"
                 f"[Pre-fetched research data — use this to answer the task]:\n{search_context}"
             )
-            loop = CoreLoop(llm, self.registry)
-            loop_result = await loop.run(enriched, verbose=False, skip_orchestrator=True)
+            loop_result = await self.loop.run(enriched, verbose=False, skip_orchestrator=True)
         else:
-            loop = CoreLoop(llm, self.registry)
-            loop_result = await loop.run(task, verbose=False, skip_orchestrator=True)
+            loop_result = await self.loop.run(task, verbose=False, skip_orchestrator=True)
 
         return AgentResult(
             agent=self.name, task=task,
             output=loop_result.output, success=loop_result.success,
-            duration=time.time() - start, error=loop_result.error,
+            duration=time.perf_counter() - start, error=loop_result.error,
         )
-
-    async def run(self, task: str) -> AgentResult:
-        start = time.time()
-        # Q-7.5: cross-agent knowledge sharing
-        effective_task = await self._enrich_with_cross_insights(task)
-        result = await self._run_impl(effective_task, start)
-        await self._save_reflection(task, result)
-        return result
@@ -2,20 +2,21 @@ import re
 import time
 from pathlib import Path
 
-from .base import BaseAgent, AgentResult, TemperatureLocked
-from src.organism.core.loop import CoreLoop
+from .base import BaseAgent, AgentResult
 from src.organism.llm.base import Message
 from src.organism.tools.base import OUTPUTS_DIR
 
 # Tasks shorter than this go straight to single-pass (outline overhead not worth it)
 _SIMPLE_THRESHOLD = 50
 
+_FILENAME_RE = re.compile(
+    r"(\w[\w\-]+\.(?:md|txt|docx|html|csv|xlsx|json|pdf|pptx))",
+    re.IGNORECASE,
+)
+
 
 def _extract_filename(task: str) -> str:
-    m = re.search(
-        r"(\w[\w\-]+\.(?:md|txt|docx|html|csv|xlsx|json|pdf|pptx))",
-        task, re.IGNORECASE,
-    )
+    m = _FILENAME_RE.search(task)
     return m.group(1) if m else "output.md"
 
 
@@ -137,20 +138,18 @@ class WriterAgent(BaseAgent):
 
     async def _single_pass(self, task: str, start: float) -> AgentResult:
         try:
-            llm = TemperatureLocked(self.llm, self.temperature)
-            loop = CoreLoop(llm, self.registry)
-            loop_result = await loop.run(task, skip_orchestrator=True)
+            loop_result = await self.loop.run(task, skip_orchestrator=True)
             return AgentResult(
                 agent=self.name, task=task,
                 output=loop_result.answer or loop_result.error or "",
                 success=loop_result.success,
-                duration=time.time() - start,
+                duration=time.perf_counter() - start,
                 error=loop_result.error or "",
             )
         except Exception as e:
             return AgentResult(
                 agent=self.name, task=task, output="",
-                success=False, duration=time.time() - start, error=str(e),
+                success=False, duration=time.perf_counter() - start, error=str(e),
             )
 
     # ------------------------------------------------------------------
@@ -171,15 +170,7 @@ class WriterAgent(BaseAgent):
             return AgentResult(
                 agent=self.name, task=task,
                 output=polished, success=True,
-                duration=time.time() - start,
+                duration=time.perf_counter() - start,
             )
         except Exception:
             return await self._single_pass(task, start)
-
-    async def run(self, task: str) -> AgentResult:
-        start = time.time()
-        # Q-7.5: cross-agent knowledge sharing
-        effective_task = await self._enrich_with_cross_insights(task)
-        result = await self._run_impl(effective_task, start)
-        await self._save_reflection(task, result)
-        return result
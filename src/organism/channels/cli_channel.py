@@ -8,6 +8,8 @@ from src.organism.channels.base import BaseChannel, IncomingMessage, OutgoingMes
 if TYPE_CHECKING:
     from src.organism.channels.gateway import Gateway
 
+_EXIT_COMMANDS = frozenset({"exit", "quit", "q"})
+
 
 class CLIChannel(BaseChannel):
     """Simple CLI channel for interactive mode."""
@@ -16,6 +18,7 @@ class CLIChannel(BaseChannel):
         self.gateway = gateway
 
     async def start(self) -> None:
+        self.gateway.loop.prewarm()  # memory warmup overlaps the first prompt
         print("Organism AI interactive mode. Type 'exit' to quit.\n")
         while True:
             try:
@@ -25,7 +28,7 @@ class CLIChannel(BaseChannel):
                 break
             if not task:
                 continue
-            if task.lower() in ("exit", "quit", "q"):
+            if len(task) <= 4 and task.lower() in _EXIT_COMMANDS:
                 print("Bye.")
                 break
             incoming = IncomingMessage(
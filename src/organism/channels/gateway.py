@@ -108,8 +108,12 @@ class Gateway:
                 if result.answer and not result.answer.startswith("Saved to")
                 else result.output
             )
-            lines = [ln for ln in raw.splitlines() if not ln.startswith("Saved to")]
-            response_text = "\n".join(lines).strip() or "Done"
+            if "Saved to" in raw:
+                response_text = "\n".join(
+                    ln for ln in raw.splitlines() if not ln.startswith("Saved to")
+                ).strip() or "Done"
+            else:
+                response_text = raw.strip() or "Done"
         else:
             response_text = f"Error: {result.error}" if result.error else "Task failed"
 
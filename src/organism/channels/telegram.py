@@ -5,6 +5,7 @@ import io
 import os
 import subprocess
 import tempfile
+import time
 
 import openai
 from aiogram import Bot, Dispatcher, F
@@ -12,6 +13,7 @@ from aiogram.filters import CommandStart, Command
 from aiogram.types import Message, FSInputFile, CallbackQuery, InlineKeyboardMarkup, InlineKeyboardButton
 
 from src.organism.channels.base import BaseChannel, IncomingMessage, OutgoingMessage
+from src.organism.utils.io import make_temp_file, remove_file
 from config.settings import settings
 
 # FIX-21: Binary file extensions that must not be read as text
@@ -20,6 +22,10 @@ BINARY_EXTENSIONS = (".xlsx", ".pptx", ".pdf", ".docx", ".zip", ".png", ".jpg",
 # TG-UX: Max stored task texts for retry (prevents unbounded growth)
 _MAX_TASK_TEXTS = 100
 
+# Min seconds between per-step progress edits — Telegram rate-limits
+# edit_text to roughly 1 msg/s per chat, so coalesce bursts of sub-steps
+_PROGRESS_EDIT_INTERVAL = 3.0
+
 
 def _escape_html(text: str) -> str:
     """Escape HTML special characters for Telegram HTML parse_mode."""
@@ -44,6 +50,53 @@ def _retry_keyboard(msg_id: int) -> InlineKeyboardMarkup:
     ])
 
 
+class _ProgressReporter:
+    """Debounced wrapper around `status_msg.edit_text`.
+
+    Guarantees at most one edit per `interval` seconds regardless of how
+    fast CoreLoop emits progress, but never loses the latest state: an
+    update arriving inside the window is kept and flushed by a single
+    trailing timer, so the final sub-step is always rendered.
+    """
+
+    def __init__(self, edit, interval: float = _PROGRESS_EDIT_INTERVAL) -> None:
+        self._edit = edit  # async callable(text) bound to the status message
+        self._interval = interval
+        self._last_edit = 0.0
+        self._pending: str | None = None
+        self._timer: asyncio.TimerHandle | None = None
+
+    def update(self, text: str) -> None:
+        self._pending = text
+        now = time.monotonic()
+        if now - self._last_edit >= self._interval:
+            self._flush()
+        elif self._timer is None:
+            delay = self._interval - (now - self._last_edit)
+            self._timer = asyncio.get_running_loop().call_later(delay, self._flush)
+
+    def _flush(self) -> None:
+        self._timer = None
+        text, self._pending = self._pending, None
+        if text is None:
+            return
+        self._last_edit = time.monotonic()
+        asyncio.create_task(self._safe_edit(text))
+
+    async def _safe_edit(self, text: str) -> None:
+        try:
+            await self._edit(text)
+        except Exception:
+            pass  # FloodWait / MessageNotModified
+
+    def close(self) -> None:
+        """Cancel any trailing edit (task finished, result is on its way)."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._pending = None
+
+
 class TelegramChannel(BaseChannel):
 
     def __init__(self, gateway) -> None:
@@ -53,6 +106,9 @@ class TelegramChannel(BaseChannel):
         # TG-UX: active tasks for cancel, task texts for retry
         self._active_tasks: dict[int, tuple[asyncio.Task, str]] = {}
         self._task_texts: dict[int, str] = {}
+        # Cap concurrent CoreLoop runs; updates beyond the cap queue here
+        # instead of blocking the dispatcher.
+        self._task_sem = asyncio.Semaphore(settings.telegram_max_concurrent_tasks)
         self._setup_handlers()
 
     # \u2500\u2500 Progress ticker \u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500
@@ -61,6 +117,8 @@ class TelegramChannel(BaseChannel):
         """Edit status message every 5s with elapsed time while task runs."""
         icons = ["\u23f3", "\U0001f504"]
         elapsed = 0
+        esc_preview = _escape_html(preview)  # escape once, not per tick
+        last_text = ""
         self._current_tool: str = ""
         while True:
             await asyncio.sleep(5)
@@ -69,13 +127,15 @@ class TelegramChannel(BaseChannel):
             tool_hint = ""
             if self._current_tool:
                 tool_hint = f"\n\U0001f527 {_escape_html(self._current_tool)}"
+            text = (
+                f"{icon} <b>\u0412\u044b\u043f\u043e\u043b\u043d\u044f\u044e...</b> {elapsed}\u0441"
+                f"\n<i>{esc_preview}</i>{tool_hint}"
+            )
+            if text == last_text:
+                continue  # skip no-op edits (MessageNotModified round-trip)
+            last_text = text
             try:
-                await msg.edit_text(
-                    f"{icon} <b>\u0412\u044b\u043f\u043e\u043b\u043d\u044f\u044e...</b> {elapsed}\u0441"
-                    f"\n<i>{_escape_html(preview)}</i>{tool_hint}",
-                    parse_mode="HTML",
-                    reply_markup=stop_kb,
-                )
+                await msg.edit_text(text, parse_mode="HTML", reply_markup=stop_kb)
             except Exception:
                 pass  # ignore FloodWait / MessageNotModified
 
@@ -123,10 +183,7 @@ class TelegramChannel(BaseChannel):
                         FSInputFile(file_path, filename=fname), caption=_caption,
                     )
                 finally:
-                    try:
-                        os.unlink(file_path)
-                    except Exception:
-                        pass
+                    await remove_file(file_path)
             else:
                 try:
                     with open(file_path, "r", encoding="utf-8") as f:
@@ -149,10 +206,7 @@ class TelegramChannel(BaseChannel):
                             FSInputFile(file_path, filename=fname),
                         )
                     finally:
-                        try:
-                            os.unlink(file_path)
-                        except Exception:
-                            pass
+                        await remove_file(file_path)
                 except Exception:
                     try:
                         await status_msg.edit_text(
@@ -171,10 +225,7 @@ class TelegramChannel(BaseChannel):
                 except Exception:
                     pass
                 finally:
-                    try:
-                        os.unlink(extra_path)
-                    except Exception:
-                        pass
+                    await remove_file(extra_path)
 
         elif response.text.startswith("Error:"):
             err = response.text[7:]
@@ -215,6 +266,13 @@ class TelegramChannel(BaseChannel):
 
     async def _run_task(
         self, message: Message, task: str, media: list | None = None,
+    ) -> None:
+        """Run a task, bounded by the concurrency semaphore."""
+        async with self._task_sem:
+            await self._run_task_inner(message, task, media)
+
+    async def _run_task_inner(
+        self, message: Message, task: str, media: list | None = None,
     ) -> None:
         """Run a task with progress ticker, cancel/retry buttons, HTML output."""
         preview = task[:60] + ("..." if len(task) > 60 else "")
@@ -236,19 +294,22 @@ class TelegramChannel(BaseChannel):
         async def _tool_progress(tool_name: str, round_num: int, max_rounds: int) -> None:
             self._current_tool = f"{tool_name} (\u0448\u0430\u0433 {round_num}/{max_rounds})"
 
-        # Q-9.9: Progress callback for task decomposition
+        # Q-9.9: Progress callback for task decomposition.
+        # Debounced — fast sub-steps otherwise hammer the edit_text rate limit.
+        async def _edit_status(text: str) -> None:
+            await status_msg.edit_text(
+                text, parse_mode="HTML", reply_markup=stop_kb,
+            )
+
+        reporter = _ProgressReporter(_edit_status)
+
         async def _subtask_progress(current: int, total: int, subtask_preview: str) -> None:
-            try:
-                await status_msg.edit_text(
-                    f"<b>\u23f3 \u0412\u044b\u043f\u043e\u043b\u043d\u044f\u044e</b>\n"
-                    f"<i>{_escape_html(preview)}</i>\n\n"
-                    f"\u0427\u0430\u0441\u0442\u044c {current}/{total}: "
-                    f"{_escape_html(subtask_preview[:60])}...",
-                    parse_mode="HTML",
-                    reply_markup=stop_kb,
-                )
-            except Exception:
-                pass
+            reporter.update(
+                f"<b>\u23f3 \u0412\u044b\u043f\u043e\u043b\u043d\u044f\u044e</b>\n"
+                f"<i>{_escape_html(preview)}</i>\n\n"
+                f"\u0427\u0430\u0441\u0442\u044c {current}/{total}: "
+                f"{_escape_html(subtask_preview[:60])}...",
+            )
 
         incoming = IncomingMessage(
             text=task,
@@ -320,6 +381,7 @@ class TelegramChannel(BaseChannel):
             return
         finally:
             ticker.cancel()
+            reporter.close()
             self._active_tasks.pop(status_msg.message_id, None)
             self._current_tool = ""
 
@@ -328,11 +390,14 @@ class TelegramChannel(BaseChannel):
     # \u2500\u2500 Handlers \u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500
 
     def _setup_handlers(self) -> None:
-        allowed = settings.allowed_user_ids
+        allowed = frozenset(settings.allowed_user_ids or ())
+
+        def _denied(message: Message) -> bool:
+            return bool(allowed) and message.from_user.id not in allowed
 
         @self.dp.message(CommandStart())
         async def cmd_start(message: Message) -> None:
-            if allowed and message.from_user.id not in allowed:
+            if _denied(message):
                 await message.answer("Access denied.")
                 return
             await message.answer(
@@ -345,13 +410,13 @@ class TelegramChannel(BaseChannel):
 
         @self.dp.message(Command("status"))
         async def cmd_status(message: Message) -> None:
-            if allowed and message.from_user.id not in allowed:
+            if _denied(message):
                 return
             await message.answer("Organism AI running.")
 
         @self.dp.message(F.text)
         async def handle_task(message: Message) -> None:
-            if allowed and message.from_user.id not in allowed:
+            if _denied(message):
                 await message.answer("Access denied.")
                 return
 
@@ -375,7 +440,7 @@ class TelegramChannel(BaseChannel):
 
         @self.dp.message(F.voice)
         async def handle_voice(message: Message) -> None:
-            if allowed and message.from_user.id not in allowed:
+            if _denied(message):
                 await message.answer("Access denied.")
                 return
 
@@ -385,15 +450,13 @@ class TelegramChannel(BaseChannel):
 
             try:
                 file = await self.bot.get_file(message.voice.file_id)
-                tmp = tempfile.NamedTemporaryFile(suffix=".ogg", delete=False)
-                tmp_path = tmp.name
-                tmp.close()
+                tmp_path = await make_temp_file(suffix=".ogg")
                 await self.bot.download_file(file.file_path, tmp_path)
 
                 try:
                     text = await self._transcribe_voice(tmp_path)
                 finally:
-                    os.unlink(tmp_path)
+                    await remove_file(tmp_path)
 
                 if not text or not text.strip():
                     await status_msg.edit_text(
@@ -419,7 +482,7 @@ class TelegramChannel(BaseChannel):
         # MEDIA-1: Handler for photos, videos, and image documents
         @self.dp.message(F.photo | F.video | F.document)
         async def handle_media(message: Message) -> None:
-            if allowed and message.from_user.id not in allowed:
+            if _denied(message):
                 await message.answer("Access denied.")
                 return
 
@@ -489,9 +552,7 @@ class TelegramChannel(BaseChannel):
 
                 elif message.video:
                     file = await self.bot.get_file(message.video.file_id)
-                    tmp = tempfile.NamedTemporaryFile(suffix=".mp4", delete=False)
-                    tmp_path = tmp.name
-                    tmp.close()
+                    tmp_path = await make_temp_file(suffix=".mp4")
                     try:
                         await self.bot.download_file(file.file_path, tmp_path)
                         frames = await self._extract_video_frames(tmp_path)
@@ -503,10 +564,7 @@ class TelegramChannel(BaseChannel):
                                 "media_type": "image/jpeg",
                             })
                     finally:
-                        try:
-                            os.unlink(tmp_path)
-                        except Exception:
-                            pass
+                        await remove_file(tmp_path)
 
                     if not media_items:
                         await message.answer(
@@ -634,7 +692,15 @@ class TelegramChannel(BaseChannel):
         return transcript.text
 
     async def start(self) -> None:
-        await self.dp.start_polling(self.bot)
+        self.gateway.loop.prewarm()  # overlap memory warmup with polling startup
+        # Long-poll with concurrent handler tasks: the dispatcher issues the
+        # next getUpdates immediately instead of waiting for a slow task.
+        await self.dp.start_polling(
+            self.bot,
+            handle_as_tasks=True,
+            polling_timeout=30,
+            allowed_updates=["message", "callback_query"],
+        )
 
     async def stop(self) -> None:
         await self.bot.session.close()
@@ -643,9 +709,12 @@ class TelegramChannel(BaseChannel):
         """Send outgoing message via Telegram bot."""
         chat_id = message.metadata.get("chat_id")
         if not chat_id:
-            uids = settings.allowed_user_ids
-            if uids:
-                chat_id = uids[0]
+            # Fallback: first user listed in TELEGRAM_ALLOWED_USERS. Parse
+            # the raw string — allowed_user_ids is a frozenset, and its
+            # iteration order is arbitrary per process.
+            raw = settings.telegram_allowed_users
+            if raw:
+                chat_id = int(raw.split(",")[0].strip())
             else:
                 return
         try:
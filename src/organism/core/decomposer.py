@@ -88,7 +88,7 @@ class TaskDecomposer:
         """Execute subtasks sequentially, pass context, aggregate results."""
         from src.organism.core.loop import TaskResult, StepLog
 
-        start = time.time()
+        start = time.perf_counter()
         subtask_results = []
         context_parts = []
 
@@ -141,7 +141,7 @@ class TaskDecomposer:
                 success=False,
                 output="",
                 error="\u0412\u0441\u0435 \u043f\u043e\u0434\u0437\u0430\u0434\u0430\u0447\u0438 \u043d\u0435 \u0432\u044b\u043f\u043e\u043b\u043d\u0435\u043d\u044b",
-                duration=time.time() - start,
+                duration=time.perf_counter() - start,
             )
 
         final_output = await self._aggregate(task, context_parts)
@@ -154,7 +154,7 @@ class TaskDecomposer:
             output=final_output,
             answer=final_output,
             steps=all_steps,
-            duration=time.time() - start,
+            duration=time.perf_counter() - start,
             quality_score=sum(r.quality_score for r in successful) / len(successful),
         )
 
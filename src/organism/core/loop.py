@@ -1,13 +1,19 @@
 ﻿import asyncio
+import logging
+import logging.handlers
+import queue
+import secrets
+import sys
 import time
-import uuid
 from src.organism.utils.timezone import today_local
 from dataclasses import dataclass, field
 
+from config.settings import settings
+
 from src.organism.core.evaluator import Evaluator
 from src.organism.llm.base import LLMProvider
 from src.organism.logging.logger import Logger
-from src.organism.logging.error_handler import get_logger, log_exception
+from src.organism.logging.error_handler import get_logger, log_exception, task_id_var
 from src.organism.memory.manager import MemoryManager
 from src.organism.memory.user_facts import format_for_prompt
 from src.organism.self_improvement.prompt_versioning import PromptVersionControl
@@ -17,7 +23,27 @@ from src.organism.tools.registry import ToolRegistry
 
 _log = get_logger("core.loop")
 
-@dataclass
+# Verbose task output goes through a queued logger instead of print():
+# the event loop only enqueues the record, a background thread owns the
+# stdout writes, so chatty parallel tasks don't block on terminal IO
+_vlog = logging.getLogger("organism.verbose")
+if not _vlog.handlers:
+    _v_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _vlog.addHandler(logging.handlers.QueueHandler(_v_queue))
+    _v_stdout = logging.StreamHandler(sys.stdout)
+    _v_stdout.setFormatter(logging.Formatter("%(message)s"))
+    logging.handlers.QueueListener(_v_queue, _v_stdout).start()
+    _vlog.setLevel(logging.INFO)
+    _vlog.propagate = False
+
+# Per-tool concurrency caps across all in-flight tasks: external APIs get
+# throttled proactively, Docker sandbox runs stay bounded. Unlisted tools
+# default to 5.
+TOOL_LIMITS = {"web_fetch": 8, "web_search": 4, "code_executor": 2}
+
+# slots: no per-instance __dict__ — these are created per step/task and
+# accumulated into lists that live for the whole task
+@dataclass(slots=True)
 class StepLog:
     step_id: int
     tool: str
@@ -30,7 +56,7 @@ class StepLog:
     quality_score: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskResult:
     task_id: str
     task: str
@@ -48,6 +74,13 @@ class TaskResult:
 
 class CoreLoop:
 
+    # Tools whose exit codes are a reliable success signal on their own;
+    # tasks that used only these may skip the LLM quality verdict (opt-in
+    # via EVALUATOR_SKIP_ON_SUCCESS, same flag as the heuristic skip in
+    # Evaluator). web_fetch is excluded: HTTP 200 says nothing about
+    # whether the fetched content answered the task.
+    TRUSTED_TOOLS = frozenset({"text_writer", "pptx_creator"})
+
     @staticmethod
     def _is_useful_output(output: str) -> bool:
         """Check if step output contains real content, not just an error/placeholder."""
@@ -137,6 +170,9 @@ class CoreLoop:
         if memory is not None and memory.llm is None:
             memory.llm = llm
         self.memory = memory
+        self._mem_init_task: asyncio.Task | None = None
+        self._llm_warmed = False
+        self._tool_semaphores: dict[str, asyncio.Semaphore] = {}
         # FIX-53: inject memory into memory_search tool if registered
         try:
             mem_tool = registry.get("memory_search")
@@ -144,6 +180,19 @@ class CoreLoop:
         except KeyError:
             pass
 
+    def prewarm(self) -> None:
+        """Start memory initialization in the background (idempotent).
+
+        Channels call this once their event loop is running so the
+        embedding/index warmup overlaps idle time instead of sitting on
+        the first task's critical path.
+        """
+        if self.memory is not None and self._mem_init_task is None:
+            self._mem_init_task = asyncio.create_task(self.memory.initialize())
+        if not self._llm_warmed:
+            self._llm_warmed = True
+            asyncio.create_task(self.llm.warmup())
+
     def _build_tool_definitions(self) -> list[dict]:
         """Build Anthropic-format tool definitions from registry."""
         try:
@@ -167,7 +216,7 @@ class CoreLoop:
         """
         from src.organism.llm.base import Message as LLMMessage
 
-        start = time.time()
+        start = time.perf_counter()
         today = today_local()
 
         # --- Build context ---
@@ -392,11 +441,11 @@ class CoreLoop:
                     max_tokens=8192,
                 )
         except Exception as e:
-            log_exception(_log, f"[{task_id}] Conversation LLM call failed", e)
+            log_exception(_log, "Conversation LLM call failed", e)
             answer = "\u041f\u0440\u043e\u0438\u0437\u043e\u0448\u043b\u0430 \u043e\u0448\u0438\u0431\u043a\u0430. \u041f\u043e\u043f\u0440\u043e\u0431\u0443\u0439\u0442\u0435 \u0435\u0449\u0451 \u0440\u0430\u0437."
             return TaskResult(task_id=task_id, task=task, success=False,
                               output=answer, answer=answer,
-                              duration=time.time() - start)
+                              duration=time.perf_counter() - start)
 
         # --- Handle tool calls (max 7 rounds) ---
         MAX_TOOL_ROUNDS = 10
@@ -428,7 +477,7 @@ class CoreLoop:
                     "input": tool_input,
                 })
 
-                _log.info(f"[{task_id}] Tool call: {tool_name}({str(tool_input)[:80]})")
+                _log.info("Tool call: %s(%s)", tool_name, str(tool_input)[:80])
 
                 # TG-UX: Notify progress callback with current tool name
                 if tool_progress_callback:
@@ -440,11 +489,15 @@ class CoreLoop:
                 tool_output = ""
                 try:
                     tool = self.registry.get(tool_name)
-                    result = await tool.execute(tool_input)
+                    sem = self._tool_semaphores.setdefault(
+                        tool_name, asyncio.Semaphore(TOOL_LIMITS.get(tool_name, 5)),
+                    )
+                    async with sem:
+                        result = await tool.execute(tool_input)
                     tool_output = result.output if result.exit_code == 0 else f"Error: {result.error}"
                     # FIX-52: Log tool result at WARNING to ensure visibility
-                    _log.warning("[%s] Tool result: %s exit=%s out=%s err=%s",
-                        task_id, tool_name,
+                    _log.warning("Tool result: %s exit=%s out=%s err=%s",
+                        tool_name,
                         getattr(result, "exit_code", "?"),
                         (result.output or "")[:200],
                         (result.error or "")[:200],
@@ -477,7 +530,7 @@ class CoreLoop:
                     max_tokens=8192,
                 )
             except Exception as e:
-                log_exception(_log, f"[{task_id}] Tool round {round_count} failed", e)
+                log_exception(_log, f"Tool round {round_count} failed", e)
                 break
 
         # FIX-55: Detect exhausted tool rounds with no result
@@ -499,32 +552,46 @@ class CoreLoop:
                 f"\u0437\u0430\u0434\u0430\u0447\u0443."
             )
 
-        duration = time.time() - start
+        duration = time.perf_counter() - start
         success = not exhausted
-        _log.info(f"[{task_id}] Handler: {round_count} tool rounds, {duration:.1f}s, success={success}")
+        _log.info("Handler: %d tool rounds, %.1fs, success=%s", round_count, duration, success)
+
+        # dict.fromkeys: O(n) dedupe that keeps first-use order
+        tools_used = list(dict.fromkeys(tc.get("name") for tc in all_tool_calls))
 
         # ARCH-1.1: Evaluate quality via Evaluator (not binary)
         quality_score = 0.8 if success else 0.2  # fallback default
-        try:
-            from src.organism.tools.base import ToolResult as _TR
-            _eval_tr = _TR(
-                output=answer,
-                exit_code=0 if success else 1,
-                error="" if success else "exhausted tool rounds",
-            )
-            eval_result = await self.evaluator.evaluate(
-                task=task,
-                step_description=f"\u0412\u044b\u043f\u043e\u043b\u043d\u0435\u043d\u0438\u0435 \u0437\u0430\u0434\u0430\u0447\u0438: {task[:100]}",
-                result=_eval_tr,
-            )
-            quality_score = eval_result.quality_score
-            _log.info(f"[{task_id}] quality_score={eval_result.quality_score:.2f}")
-        except Exception as e:
-            log_exception(_log, f"[{task_id}] Evaluator failed, using fallback", e)
+        skip_eval = (
+            settings.evaluator_skip_on_success
+            and success and answer and tools_used
+            and all(t in self.TRUSTED_TOOLS for t in tools_used)
+        )
+        if skip_eval:
+            # Trusted tools report failures via exit codes themselves —
+            # skip the LLM verdict round-trip. The assumed 0.9 crosses the
+            # SolutionCache/few-shot quality gates, hence the opt-in flag.
+            quality_score = 0.9
+            _log.debug("Evaluator skipped: trusted tools %s", tools_used)
+        else:
+            try:
+                from src.organism.tools.base import ToolResult as _TR
+                _eval_tr = _TR(
+                    output=answer,
+                    exit_code=0 if success else 1,
+                    error="" if success else "exhausted tool rounds",
+                )
+                eval_result = await self.evaluator.evaluate(
+                    task=task,
+                    step_description=f"\u0412\u044b\u043f\u043e\u043b\u043d\u0435\u043d\u0438\u0435 \u0437\u0430\u0434\u0430\u0447\u0438: {task[:100]}",
+                    result=_eval_tr,
+                )
+                quality_score = eval_result.quality_score
+                _log.info("quality_score=%.2f", eval_result.quality_score)
+            except Exception as e:
+                log_exception(_log, "Evaluator failed, using fallback", e)
 
         # PERF-2: Fire-and-forget memory save — don't block user response
         if self.memory:
-            tools_used = list({tc.get("name") for tc in all_tool_calls}) or []
             asyncio.create_task(self._safe_post_task(
                 task, answer, success, duration,
                 round_count, tools_used, quality_score, user_id,
@@ -553,7 +620,10 @@ class CoreLoop:
                 user_id=user_id,
             )
         except Exception as e:
-            _log.warning(f"Post-task memory save failed: {e}")
+            _log.warning("Post-task memory save failed: %s", e)
+        finally:
+            # Batched task-log records become durable at task end, off-loop
+            await asyncio.to_thread(self.logger.flush)
 
     async def _classify_complex(self, task: str) -> bool:
         """ARCH-1.4: Haiku classifier — does this task need multiple agents?"""
@@ -572,13 +642,32 @@ class CoreLoop:
         return "yes" in resp.content.strip().lower()
 
     async def run(self, task: str, verbose: bool = True, user_id: str = "default", media: list | None = None, progress_callback=None, user_context: str = "", skip_orchestrator: bool = False, extra_system_context: str = "", tool_progress_callback=None, personality_id: str = "") -> "TaskResult":
-        task_id = uuid.uuid4().hex[:8]
-        start = time.time()
-        _log.info(f"[{task_id}] Task started: {task[:100]}")
+        try:
+            return await self._run(
+                task, verbose=verbose, user_id=user_id, media=media,
+                progress_callback=progress_callback, user_context=user_context,
+                skip_orchestrator=skip_orchestrator,
+                extra_system_context=extra_system_context,
+                tool_progress_callback=tool_progress_callback,
+                personality_id=personality_id,
+            )
+        finally:
+            # Batched task-log records become durable at task end on every
+            # path — including cache hits, early error returns, and setups
+            # without memory (where _safe_post_task is never scheduled)
+            await asyncio.to_thread(self.logger.flush)
+
+    async def _run(self, task: str, verbose: bool = True, user_id: str = "default", media: list | None = None, progress_callback=None, user_context: str = "", skip_orchestrator: bool = False, extra_system_context: str = "", tool_progress_callback=None, personality_id: str = "") -> "TaskResult":
+        task_id = secrets.token_hex(4)
+        # Bind the task id for every log record in this task's context;
+        # asyncio tasks copy the context, so background work inherits it
+        task_id_var.set(task_id)
+        start = time.perf_counter()
+        _log.info("Task started: %s", task[:100])
         self.logger.log_task_start(task_id, task)
 
         if verbose:
-            print(f"\n{'='*50}\nTask [{task_id}]: {task}\n{'='*50}")
+            _vlog.info("\n%s\nTask [%s]: %s\n%s", "=" * 50, task_id, task, "=" * 50)
 
         memory_hits = 0
         memory_context = ""
@@ -586,9 +675,11 @@ class CoreLoop:
         # FIX-24: Initialize memory BEFORE intent classification — needed for chat history in both paths
         if self.memory:
             try:
-                await self.memory.initialize()
+                self.prewarm()
+                await self._mem_init_task
             except Exception as e:
-                log_exception(_log, f"[{task_id}] Memory init failed", e)
+                self._mem_init_task = None  # retry on next task
+                log_exception(_log, "Memory init failed", e)
 
         # --- Build user_context (needed for ALL paths including media) ---
 
@@ -598,7 +689,7 @@ class CoreLoop:
                     user_facts = await self.memory.facts.get_all_facts(user_id=user_id)
                     user_context = format_for_prompt(user_facts)
                     if user_context and verbose:
-                        print(f"User context: {user_context}")
+                        _vlog.info("User context: %s", user_context)
                 except Exception:
                     pass
 
@@ -628,7 +719,7 @@ class CoreLoop:
                 if _fs_section:
                     user_context = user_context + "\n" + _fs_section if user_context else _fs_section
                     if verbose:
-                        print(f"Few-shot: {len(_fs_examples)} examples injected")
+                        _vlog.info("Few-shot: %d examples injected", len(_fs_examples))
             except Exception:
                 pass
 
@@ -648,20 +739,15 @@ class CoreLoop:
                 if similar:
                     memory_hits = len(similar)
                     if verbose:
-                        print(f"Memory: found {memory_hits} similar past task(s)")
-                    lines = []
-                    for s in similar:
-                        tools = s.get("tools_used") or []
-                        tool_str = ", ".join(tools) if tools else "unknown"
-                        task_str = s.get("task", "")[:70]
-                        result_str = (s.get("result") or "")[:1000].replace("\n", " ")
-                        line = f"- [{tool_str}] {task_str}"
-                        if result_str:
-                            line += f" -> {result_str}"
-                        lines.append(line)
-                    memory_context = "\n".join(lines)
+                        _vlog.info("Memory: found %d similar past task(s)", memory_hits)
+                    memory_context = "\n".join(
+                        f"- [{', '.join(s.get('tools_used') or []) or 'unknown'}]"
+                        f" {s.get('task', '')[:70]}"
+                        + (f" -> {r}" if (r := (s.get("result") or "")[:1000].replace("\n", " ")) else "")
+                        for s in similar
+                    )
             except Exception as e:
-                log_exception(_log, f"[{task_id}] Memory lookup failed", e)
+                log_exception(_log, "Memory lookup failed", e)
 
         # HIST-1: Load recent chat history for task context
         if self.memory and user_id != "default":
@@ -702,16 +788,19 @@ class CoreLoop:
                 cached = await self.memory.cache.get(cache_hash)
                 if cached:
                     if verbose:
-                        print(f"Cache HIT (quality={cached['quality_score']:.2f}, hits={cached['hits']})")
-                    _log.info(f"[{task_id}] Cache HIT hash={cache_hash[:8]} quality={cached['quality_score']:.2f}")
+                        _vlog.info(
+                            "Cache HIT (quality=%.2f, hits=%s)",
+                            cached["quality_score"], cached["hits"],
+                        )
+                    _log.info("Cache HIT hash=%s quality=%.2f", cache_hash[:8], cached["quality_score"])
                     return TaskResult(
                         task_id=task_id, task=task, success=True,
                         output=cached["result"], answer=cached["result"],
-                        duration=time.time() - start, memory_hits=memory_hits,
+                        duration=time.perf_counter() - start, memory_hits=memory_hits,
                         quality_score=cached["quality_score"],
                     )
             except Exception as e:
-                log_exception(_log, f"[{task_id}] Cache check failed", e)
+                log_exception(_log, "Cache check failed", e)
 
         # ARCH-1.4: Route complex multi-agent tasks to Orchestrator if available
         # FIX-62: skip_orchestrator prevents recursion when MetaOrchestrator calls loop.run()
@@ -721,7 +810,7 @@ class CoreLoop:
             except Exception:
                 is_complex = False
             if is_complex:
-                _log.info(f"[{task_id}] Routing to Orchestrator (complex task)")
+                _log.info("Routing to Orchestrator (complex task)")
                 try:
                     orch_result = await self._orchestrator.run(task, verbose=verbose)
                     # FIX-65: Evaluate orchestrator result via Evaluator
@@ -746,7 +835,7 @@ class CoreLoop:
                         try:
                             await self.memory.on_task_end(
                                 task, orch_result.output or "", orch_result.success,
-                                time.time() - start,
+                                time.perf_counter() - start,
                                 tools_used=["orchestrator"],
                                 quality_score=quality,
                                 user_id=user_id,
@@ -758,7 +847,7 @@ class CoreLoop:
                         success=orch_result.success,
                         output=orch_result.output,
                         answer=orch_result.output,
-                        duration=time.time() - start,
+                        duration=time.perf_counter() - start,
                         quality_score=quality,
                         error=orch_result.error,
                     )
@@ -772,7 +861,7 @@ class CoreLoop:
                             pass
                     return tr
                 except Exception as e:
-                    log_exception(_log, f"[{task_id}] Orchestrator failed, falling back", e)
+                    log_exception(_log, "Orchestrator failed, falling back", e)
 
         # Q-10.4: All tasks go through _handle_conversation (primary execution path)
         conv_result = await self._handle_conversation(
@@ -792,6 +881,6 @@ class CoreLoop:
                     conv_result.answer, conv_result.quality_score,
                 )
             except Exception as e:
-                log_exception(_log, f"[{task_id}] Cache store failed", e)
+                log_exception(_log, "Cache store failed", e)
 
         return conv_result
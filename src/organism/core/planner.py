@@ -1,13 +1,27 @@
+import copy
+import functools
+import hashlib
 import json
 import re
-from dataclasses import dataclass, field
+import time
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any
 
+from config.settings import settings
 from src.organism.llm.base import LLMProvider, Message
+from src.organism.llm.cache import get_llm_cache
+from src.organism.logging.error_handler import get_logger
 
+try:
+    import orjson  # optional: SIMD JSON parser for multi-KB planner responses
+except ImportError:
+    orjson = None
 
-@dataclass
+_log = get_logger("core.planner")
+
+
+@dataclass(slots=True)
 class PlanStep:
     id: int
     tool: str
@@ -16,8 +30,13 @@ class PlanStep:
     depends_on: list[int] = field(default_factory=list)
 
 
-FAST_PROMPT = Path("config/prompts/planner_fast.txt").read_text(encoding="utf-8")
-REACT_PROMPT = Path("config/prompts/planner_react.txt").read_text(encoding="utf-8")
+_PROMPTS_DIR = Path(__file__).resolve().parents[3] / "config" / "prompts"
+
+
+@functools.lru_cache(maxsize=None)
+def _load_prompt(name: str) -> str:
+    """Read a prompt file once, anchored at the repo root (CWD-independent)."""
+    return (_PROMPTS_DIR / f"{name}.txt").read_text(encoding="utf-8")
 
 # ---- Phase 1: Task classifier prompt (Haiku, ~100 tokens) ----
 CLASSIFIER_PROMPT = """You are a task classifier for an autonomous AI executor. Classify the user task by its primary output type. Respond with ONLY a JSON object, no explanation.
@@ -72,35 +91,101 @@ Compare documents: [pdf_tool read doc1] \u2192 [pdf_tool read doc2] \u2192 [text
 # Valid task types for classifier
 VALID_TASK_TYPES = {"writing", "code", "data", "research", "presentation", "mixed"}
 
+# Fast local pre-classifier: an unambiguous keyword hit answers Phase 1
+# without the Haiku round-trip. Patterns are deliberately narrow — any
+# cross-category ambiguity falls through to the LLM.
+_TYPE_PATTERNS: dict[str, re.Pattern] = {
+    "presentation": re.compile(
+        r"pptx|powerpoint"
+        r"|\u043f\u0440\u0435\u0437\u0435\u043d\u0442\u0430\u0446\u0438"
+    ),
+    "research": re.compile(
+        r"news|search"
+        r"|\u043d\u0430\u0439\u0434\u0438|\u0443\u0437\u043d\u0430\u0439"
+        r"|\u043d\u043e\u0432\u043e\u0441\u0442"
+    ),
+    "code": re.compile(
+        r"csv|calculate"
+        r"|\u043f\u043e\u0441\u0447\u0438\u0442\u0430\u0439"
+        r"|\u0432\u044b\u0447\u0438\u0441\u043b\u0438"
+    ),
+    "writing": re.compile(
+        r"\u043d\u0430\u043f\u0438\u0448\u0438|\u043f\u0438\u0441\u044c\u043c\u043e"
+        r"|\u0441\u0442\u0430\u0442\u044c"
+    ),
+}
+
+
+def _pre_classify(task_lower: str) -> str | None:
+    """Return a task type when exactly one category matches, else None."""
+    found = None
+    for task_type, pattern in _TYPE_PATTERNS.items():
+        if pattern.search(task_lower):
+            if found is not None:
+                return None  # ambiguous — let the LLM decide
+            found = task_type
+    return found
+
+# Plan cache: identical (task, context) pairs skip the planning LLM call
+_CACHE_MAX = 128
+_CACHE_TTL = 600.0  # seconds
+# Semantic layer: tasks whose goal embeddings are this close reuse the plan
+_SEMANTIC_THRESHOLD = 0.90
+
+
+# One linear scan instead of N substring searches per task
+_COMPLEX_RE = re.compile(
+    "|".join(map(re.escape, (
+        "and then", "after that", "first", "several steps",
+        "pptx", "powerpoint", "prezentaci",
+    )))
+)
+
+
+def _system_blocks(prompt: str, user_context: str) -> list[dict[str, Any]]:
+    """System content with a prompt-cache breakpoint on the static prompt.
+
+    The static planner prompt goes first (provider prefix caching only
+    matches from the start), marked ephemeral so repeated planning calls
+    reuse its KV states; the per-user context follows as a plain block.
+    """
+    blocks: list[dict[str, Any]] = [
+        {"type": "text", "text": prompt, "cache_control": {"type": "ephemeral"}}
+    ]
+    if user_context:
+        blocks.append({"type": "text", "text": user_context})
+    return blocks
+
 
 def _is_complex(task: str) -> bool:
     if len(task) > 200:
         return True
-    keywords = ["and then", "after that", "first", "several steps",
-                "pptx", "powerpoint", "prezentaci"]
-    return any(kw in task.lower() for kw in keywords)
+    return _COMPLEX_RE.search(task.lower()) is not None
+
+
+# Complete JSON string literals (escape-aware); raw control chars inside
+# them match [^"\\] so one C-level pass replaces the old per-char loop
+_JSON_STR_RE = re.compile(r'"(?:[^"\\]|\\.)*"', re.DOTALL)
+_CTRL_MAP = str.maketrans({'\n': '\\n', '\r': '\\r', '\t': '\\t'})
+_OBJ_DECODER = json.JSONDecoder()
 
 
 def _sanitize_json(text: str) -> str:
     """Fix control characters inside JSON strings."""
-    result = []
-    in_string = False
-    i = 0
-    while i < len(text):
-        c = text[i]
-        if c == '"' and (i == 0 or text[i-1] != '\\'):
-            in_string = not in_string
-            result.append(c)
-        elif in_string and c == '\n':
-            result.append('\\n')
-        elif in_string and c == '\r':
-            result.append('\\r')
-        elif in_string and c == '\t':
-            result.append('\\t')
-        else:
-            result.append(c)
-        i += 1
-    return ''.join(result)
+    parts = []
+    end = 0
+    for m in _JSON_STR_RE.finditer(text):
+        parts.append(text[end:m.start()])
+        parts.append(m.group(0).translate(_CTRL_MAP))
+        end = m.end()
+    tail = text[end:]
+    # Truncated responses can end inside an unterminated string literal;
+    # escape its control chars too so the recovery suffixes still parse
+    q = tail.find('"')
+    if q != -1:
+        tail = tail[:q + 1] + tail[q + 1:].translate(_CTRL_MAP)
+    parts.append(tail)
+    return ''.join(parts)
 
 
 def _extract_json(text: str) -> str:
@@ -112,10 +197,11 @@ def _extract_json(text: str) -> str:
     to complete it.
     """
     text = text.strip()
-    # Strip markdown code fences
-    text = re.sub(r'^```(?:json)?\s*', '', text)
-    text = re.sub(r'\s*```$', '', text)
-    text = text.strip()
+    # Strip markdown code fences (C-level prefix/suffix ops, no regex)
+    if text.startswith('```'):
+        text = text.removeprefix('```json').removeprefix('```').lstrip()
+    if text.endswith('```'):
+        text = text.removesuffix('```').rstrip()
 
     start = text.find('[')
     if start == -1:
@@ -209,7 +295,13 @@ def _parse_steps(raw: str) -> list[PlanStep]:
     json_str = _extract_json(raw)
     json_str = _sanitize_json(json_str)
 
-    # 1. Direct parse
+    # 1. Direct parse — orjson first when available; on failure fall through
+    # to json.loads, whose error message drives the recovery heuristics
+    if orjson is not None:
+        try:
+            return _build_steps(orjson.loads(json_str))
+        except orjson.JSONDecodeError:
+            pass
     try:
         return _build_steps(json.loads(json_str))
     except json.JSONDecodeError as e:
@@ -258,6 +350,16 @@ class Planner:
 
     def __init__(self, llm: LLMProvider) -> None:
         self.llm = llm
+        self._cache: dict[str, tuple[float, list[PlanStep]]] = {}
+        # Semantic layer: (stored_at, normalized task embedding, steps)
+        self._sem_cache: list[tuple[float, Any, list[PlanStep]]] = []
+        # Phase-1 classifier verdicts: repeated tasks skip the Haiku call
+        self._classify_cache: dict[str, str] = {}
+
+    def invalidate(self) -> None:
+        """Drop all cached plans (e.g. after tool registry changes)."""
+        self._cache.clear()
+        self._sem_cache.clear()
 
     async def plan(
         self,
@@ -267,6 +369,98 @@ class Planner:
         task_context: str | None = None,
         user_context: str = '',
         task_type_hint: str | None = None,
+    ) -> list[PlanStep]:
+        key = None
+        task_vec = None
+        if settings.plan_cache_enabled:
+            key = hashlib.blake2b(
+                f"{task}\x00{memory_context}\x00{user_context}".encode(),
+                digest_size=16,
+            ).hexdigest()
+            hit = self._cache.get(key)
+            if hit and time.monotonic() - hit[0] < _CACHE_TTL:
+                return copy.deepcopy(hit[1])
+            # Semantic layer (opt-in): reworded versions of a recurring goal
+            # reuse the plan instead of re-paying the planning LLM call
+            if settings.plan_cache_semantic:
+                task_vec = await self._task_vector(task)
+                if task_vec is not None:
+                    near = self._nearest_plan(task_vec)
+                    if near is not None:
+                        return near
+            # Persistent layer (dev/benchmark: survives process restarts)
+            disk = get_llm_cache()
+            if disk is not None:
+                try:
+                    stored = disk.get(key)
+                    if stored:
+                        steps = [PlanStep(**s) for s in stored]
+                        self._cache[key] = (time.monotonic(), copy.deepcopy(steps))
+                        return steps
+                except (TypeError, KeyError):
+                    pass  # stale schema — replan
+
+        steps = await self._plan(
+            task, memory_context, knowledge_rules,
+            task_context, user_context, task_type_hint,
+        )
+
+        if key is not None and steps:
+            if len(self._cache) >= _CACHE_MAX:
+                self._cache.pop(next(iter(self._cache)))
+            self._cache[key] = (time.monotonic(), copy.deepcopy(steps))
+            if task_vec is not None:
+                if len(self._sem_cache) >= _CACHE_MAX:
+                    self._sem_cache.pop(0)
+                self._sem_cache.append(
+                    (time.monotonic(), task_vec, copy.deepcopy(steps))
+                )
+            disk = get_llm_cache()
+            if disk is not None:
+                disk.put(key, [asdict(s) for s in steps])
+        return steps
+
+    async def _task_vector(self, task: str):
+        """Normalized embedding of the task goal, or None when unavailable."""
+        try:
+            from src.organism.memory.embeddings import get_embedding
+            emb = await get_embedding(task)
+        except Exception:
+            return None
+        if not emb:
+            return None
+        import numpy as np
+        vec = np.asarray(emb, dtype=np.float32)
+        norm = float(np.linalg.norm(vec))
+        if norm == 0.0:
+            return None
+        return vec / norm
+
+    def _nearest_plan(self, task_vec) -> list[PlanStep] | None:
+        """Top-1 cosine lookup over cached plans (vectors are pre-normalized)."""
+        now = time.monotonic()
+        best_sim = 0.0
+        best_steps = None
+        for stored_at, other_vec, steps in self._sem_cache:
+            if now - stored_at >= _CACHE_TTL:
+                continue
+            sim = float(task_vec @ other_vec)
+            if sim > best_sim:
+                best_sim = sim
+                best_steps = steps
+        if best_steps is not None and best_sim >= _SEMANTIC_THRESHOLD:
+            _log.info("planner: cache hit sim=%.2f", best_sim)
+            return copy.deepcopy(best_steps)
+        return None
+
+    async def _plan(
+        self,
+        task: str,
+        memory_context: str = '',
+        knowledge_rules: list[str] | None = None,
+        task_context: str | None = None,
+        user_context: str = '',
+        task_type_hint: str | None = None,
     ) -> list[PlanStep]:
         # Use pre-built task_context if provided; otherwise build it here
         if task_context is not None:
@@ -279,12 +473,11 @@ class Planner:
             if memory_context:
                 full_task = f"{full_task}\n\n[Memory: {memory_context[:200]}]"
 
-        # Phase 1: Classify task type (Haiku — fast, cheap).
-        # task_type_hint can override the classifier (e.g. force "writing" for memory-answer tasks).
-        if task_type_hint and task_type_hint in VALID_TASK_TYPES:
-            task_type = task_type_hint
-        else:
-            task_type = await self._classify(task, user_context)
+        # Phase 1 classification is folded into planning: the universal
+        # prompt (Q-10.1) chooses tools directly, and nothing downstream
+        # consumed the type any more — so the separate Haiku round-trip
+        # that used to block every plan is gone. _classify stays available
+        # for callers that want a standalone verdict.
 
         # Phase 2: Universal planner (Q-10.1)
         use_react = _is_complex(task)
@@ -303,7 +496,18 @@ class Planner:
 
     async def _classify(self, task: str, user_context: str = '') -> str:
         """Phase 1: Classify task type using Haiku (fast, ~100 tokens)."""
-        sys = f"{user_context}\n\n{CLASSIFIER_PROMPT}" if user_context else CLASSIFIER_PROMPT
+        local = _pre_classify(task.lower())
+        if local is not None:
+            return local
+
+        cache_key = hashlib.blake2b(
+            f"{task}\x00{user_context}".encode(), digest_size=16,
+        ).hexdigest()
+        cached = self._classify_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        sys = _system_blocks(CLASSIFIER_PROMPT, user_context)
         try:
             response = await self.llm.complete(
                 messages=[Message(role='user', content=task)],
@@ -312,54 +516,125 @@ class Planner:
                 max_tokens=150,
             )
             text = response.content.strip()
-            # Extract JSON
-            match = re.search(r'\{[\s\S]*\}', text)
-            if match:
-                data = json.loads(match.group(0))
+            # Extract JSON: decode from the first '{' instead of a greedy
+            # regex that backtracks over the whole response
+            start = text.find('{')
+            data = None
+            if start != -1:
+                try:
+                    data, _ = _OBJ_DECODER.raw_decode(text, start)
+                except json.JSONDecodeError:
+                    pass
+            if isinstance(data, dict):
                 task_type = data.get('type', 'mixed')
                 if task_type in VALID_TASK_TYPES:
+                    if len(self._classify_cache) >= _CACHE_MAX:
+                        self._classify_cache.pop(next(iter(self._classify_cache)))
+                    self._classify_cache[cache_key] = task_type
                     return task_type
         except Exception:
             pass
         return 'mixed'
 
+    async def _stream_plan_text(self, sys: list[dict[str, Any]], messages: list[Message]) -> str:
+        """Collect streamed plan text, stopping once the JSON array closes.
+
+        The plan is usable as soon as its closing ']' arrives; breaking
+        out of the stream cancels whatever trailing prose the model would
+        have generated, so latency tracks the array, not the full response.
+        """
+        # Incremental scanner: brackets inside string literals are ignored,
+        # and counting starts only at a '[' whose next non-space char is
+        # '{' or ']' — prose brackets in a preamble ("plan [1]:") don't
+        # terminate the stream before the array arrives.
+        chunks: list[str] = []
+        depth = 0
+        started = False
+        maybe = False  # saw '[' at top level — confirm with next non-space char
+        in_string = False
+        escaped = False
+        done = False
+        gen = self.llm.complete_stream(
+            messages=messages,
+            system=sys,
+            model_tier='balanced',
+            max_tokens=4096,
+        )
+        try:
+            async for chunk in gen:
+                chunks.append(chunk)
+                for ch in chunk:
+                    if not started:
+                        if maybe:
+                            if ch.isspace():
+                                continue
+                            if ch == '{':
+                                started = True
+                                depth = 1
+                                maybe = False
+                            elif ch == ']':
+                                done = True  # empty plan: "[]"
+                                break
+                            else:
+                                maybe = ch == '['  # prose bracket — keep looking
+                        elif ch == '[':
+                            maybe = True
+                        continue
+                    if escaped:
+                        escaped = False
+                    elif ch == '\\':
+                        escaped = in_string
+                    elif ch == '"':
+                        in_string = not in_string
+                    elif in_string:
+                        pass
+                    elif ch == '[':
+                        depth += 1
+                    elif ch == ']':
+                        depth -= 1
+                        if depth == 0:
+                            done = True
+                            break
+                if done:
+                    break
+        finally:
+            await gen.aclose()
+        return ''.join(chunks)
+
     async def _universal_plan(self, task: str, user_context: str = '') -> list[PlanStep]:
         """Phase 2: Plan with universal prompt (Q-10.1)."""
-        sys = f"{user_context}\n\n{PLAN_UNIVERSAL}" if user_context else PLAN_UNIVERSAL
-
-        for attempt in range(2):
-            hint = '' if attempt == 0 else '\nReturn ONLY valid JSON array, no explanation.'
-            response = await self.llm.complete(
-                messages=[Message(role='user', content=task + hint)],
-                system=sys,
-                model_tier='balanced',
-                max_tokens=4096,
-            )
-            try:
-                return _parse_steps(response.content)
-            except (json.JSONDecodeError, KeyError):
-                continue
-        return []
+        sys = _system_blocks(PLAN_UNIVERSAL, user_context)
+        return await self._plan_with_retry(sys, task)
 
     async def _fast_plan(self, task: str, user_context: str = '') -> list[PlanStep]:
         """Fallback: generic plan with all tools."""
-        sys = f"{user_context}\n\n{FAST_PROMPT}" if user_context else FAST_PROMPT
+        sys = _system_blocks(_load_prompt("planner_fast"), user_context)
+        return await self._plan_with_retry(sys, task)
+
+    async def _plan_with_retry(
+        self, sys: list[dict[str, Any]], task: str
+    ) -> list[PlanStep]:
+        """One planning attempt plus one repair attempt.
+
+        The retry hint goes in as a new conversation turn (with the broken
+        response as the assistant turn) instead of being concatenated onto
+        the task — the original user turn stays a stable prefix, so the
+        provider-side prompt cache survives the retry.
+        """
+        messages = [Message(role='user', content=task)]
         for attempt in range(2):
-            hint = '' if attempt == 0 else '\nReturn ONLY valid JSON array, no explanation.'
-            response = await self.llm.complete(
-                messages=[Message(role='user', content=task + hint)],
-                system=sys,
-                model_tier='balanced',
-                max_tokens=4096,
-            )
+            raw = await self._stream_plan_text(sys, messages)
             try:
-                return _parse_steps(response.content)
+                return _parse_steps(raw)
             except (json.JSONDecodeError, KeyError):
-                continue
+                messages = messages + [
+                    Message(role='assistant', content=raw or '[]'),
+                    Message(role='user', content='Return ONLY valid JSON array, no explanation.'),
+                ]
         return []
 
     async def _react_plan(self, task: str, user_context: str = '') -> list[PlanStep]:
-        sys = f"{user_context}\n\n{REACT_PROMPT}" if user_context else REACT_PROMPT
+        sys = _system_blocks(_load_prompt("planner_react"), user_context)
         response = await self.llm.complete(
             messages=[Message(role='user', content=task)],
             system=sys,
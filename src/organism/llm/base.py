@@ -21,6 +21,10 @@ class LLMResponse:
     tool_calls: list[dict[str, Any]] = field(default_factory=list)
     input_tokens: int = 0
     output_tokens: int = 0
+    # Prompt-cache accounting (Anthropic): tokens written to / served from
+    # the provider-side prefix cache on this call
+    cache_creation_tokens: int = 0
+    cache_read_tokens: int = 0
 
     @property
     def total_tokens(self) -> int:
@@ -37,7 +41,7 @@ class LLMProvider(ABC):
     async def complete(
         self,
         messages: list[Message],
-        system: str = "",
+        system: str | list = "",
         model_tier: str = "balanced",
         max_tokens: int = 4096,
         temperature: float | None = None,
@@ -49,13 +53,40 @@ class LLMProvider(ABC):
         self,
         messages: list[Message],
         tools: list[dict[str, Any]],
-        system: str = "",
+        system: str | list = "",
         model_tier: str = "balanced",
         max_tokens: int = 4096,
         temperature: float | None = None,
     ) -> LLMResponse:
         """Completion with function calling."""
 
+    async def warmup(self) -> None:
+        """Open transport connections ahead of the first completion.
+
+        Default is a no-op; providers with lazy HTTP clients override
+        this to pay the TCP+TLS handshake off the critical path.
+        """
+
+    async def complete_stream(
+        self,
+        messages: list[Message],
+        system: str | list = "",
+        model_tier: str = "balanced",
+        max_tokens: int = 4096,
+        temperature: float | None = None,
+    ):
+        """Yield response text incrementally.
+
+        Default falls back to a single complete() call yielded as one
+        chunk; streaming providers override this so callers can stop
+        generation early (e.g. once a JSON payload is closed).
+        """
+        response = await self.complete(
+            messages, system=system, model_tier=model_tier,
+            max_tokens=max_tokens, temperature=temperature,
+        )
+        yield response.content
+
 
 class TemperatureLocked(LLMProvider):
     """Wraps any LLMProvider and pins temperature for all calls.
@@ -71,7 +102,7 @@ class TemperatureLocked(LLMProvider):
     async def complete(
         self,
         messages: list[Message],
-        system: str = "",
+        system: str | list = "",
         model_tier: str = "balanced",
         max_tokens: int = 4096,
         temperature: float | None = None,
@@ -85,7 +116,7 @@ class TemperatureLocked(LLMProvider):
         self,
         messages: list[Message],
         tools: list[dict[str, Any]],
-        system: str = "",
+        system: str | list = "",
         model_tier: str = "balanced",
         max_tokens: int = 4096,
         temperature: float | None = None,
@@ -94,3 +125,24 @@ class TemperatureLocked(LLMProvider):
             messages, tools, system=system, model_tier=model_tier,
             max_tokens=max_tokens, temperature=self._temperature,
         )
+
+    async def warmup(self) -> None:
+        await self._provider.warmup()
+
+    async def complete_stream(
+        self,
+        messages: list[Message],
+        system: str | list = "",
+        model_tier: str = "balanced",
+        max_tokens: int = 4096,
+        temperature: float | None = None,
+    ):
+        gen = self._provider.complete_stream(
+            messages, system=system, model_tier=model_tier,
+            max_tokens=max_tokens, temperature=self._temperature,
+        )
+        try:
+            async for chunk in gen:
+                yield chunk
+        finally:
+            await gen.aclose()
@@ -0,0 +1,78 @@
+"""Persistent cross-run cache for deterministic LLM-derived results.
+
+The in-memory caches (Planner plan cache, Evaluator memo) die with the
+process, so repeated dev/benchmark runs over the same tasks re-pay every
+LLM round-trip. This adds an opt-in SQLite layer underneath them: set
+ORGANISM_CACHE_DIR to enable. Only parsed, deterministic artifacts are
+stored (plan step lists, eval verdicts) — never raw model output.
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from functools import lru_cache
+from pathlib import Path
+
+from config.settings import settings
+
+_MAX_AGE_SECONDS = 7 * 24 * 3600  # entries older than a week are pruned
+
+
+class LLMCache:
+
+    def __init__(self, cache_dir: str) -> None:
+        path = Path(cache_dir)
+        path.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path / "llm_cache.db")
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache "
+            "(key TEXT PRIMARY KEY, value TEXT, created_at INTEGER)"
+        )
+        self._conn.execute(
+            "DELETE FROM cache WHERE created_at < ?",
+            (int(time.time()) - _MAX_AGE_SECONDS,),
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(kind: str, *parts: str) -> str:
+        """SHA256 over canonical JSON of (kind, parts)."""
+        payload = json.dumps([kind, *parts], ensure_ascii=False)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> dict | list | None:
+        try:
+            row = self._conn.execute(
+                "SELECT value FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None:
+            return None
+        try:
+            return json.loads(row[0])
+        except json.JSONDecodeError:
+            return None
+
+    def put(self, key: str, value: dict | list) -> None:
+        try:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, created_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False), int(time.time())),
+            )
+            self._conn.commit()
+        except sqlite3.Error:
+            pass  # cache write failure must never break the task
+
+
+@lru_cache(maxsize=1)
+def get_llm_cache() -> LLMCache | None:
+    """Shared cache instance, or None when ORGANISM_CACHE_DIR is not set."""
+    if not settings.llm_cache_dir:
+        return None
+    try:
+        return LLMCache(settings.llm_cache_dir)
+    except Exception:
+        return None
@@ -1,9 +1,18 @@
 import anthropic
+from functools import lru_cache
 from typing import Any
 from .base import LLMProvider, LLMResponse, Message
 from config.settings import settings
 
 
+@lru_cache(maxsize=1)
+def get_llm() -> "ClaudeProvider":
+    """Process-wide ClaudeProvider — one AsyncAnthropic client means one
+    connection pool, so entry points reuse keepalive sockets instead of
+    paying TCP+TLS handshakes per provider instance."""
+    return ClaudeProvider()
+
+
 class ClaudeProvider(LLMProvider):
 
     def __init__(self) -> None:
@@ -19,15 +28,34 @@ class ClaudeProvider(LLMProvider):
     def _get_model(self, tier: str) -> str:
         return self._models.get(tier, self._models["balanced"])
 
+    async def warmup(self) -> None:
+        """Complete the TCP+TLS handshake to the API before the first task.
+
+        A bare GET on the base URL is enough to populate the keepalive
+        pool; the (expected) 4xx body is discarded.
+        """
+        try:
+            await self.client._client.get(str(self.client.base_url), timeout=2.0)
+        except Exception:
+            pass
+
     def _to_anthropic_messages(
         self, messages: list[Message]
     ) -> list[dict[str, Any]]:
         return [{"role": m.role, "content": m.content} for m in messages]
 
+    @staticmethod
+    def _cache_usage(usage: Any) -> tuple[int, int]:
+        """Prompt-cache token counts from a usage block (0 when absent)."""
+        return (
+            getattr(usage, "cache_creation_input_tokens", 0) or 0,
+            getattr(usage, "cache_read_input_tokens", 0) or 0,
+        )
+
     async def complete(
         self,
         messages: list[Message],
-        system: str = "",
+        system: str | list = "",
         model_tier: str = "balanced",
         max_tokens: int = 4096,
         temperature: float | None = None,
@@ -38,6 +66,8 @@ class ClaudeProvider(LLMProvider):
             "messages":   self._to_anthropic_messages(messages),
         }
         if system:
+            # str, or a list of content blocks (callers may set cache_control
+            # on static blocks to reuse provider-side prefix KV states)
             kwargs["system"] = system
         if temperature is not None:
             kwargs["temperature"] = temperature
@@ -49,17 +79,47 @@ class ClaudeProvider(LLMProvider):
             if hasattr(block, "text"):
                 content += block.text
 
+        created, read = self._cache_usage(response.usage)
         return LLMResponse(
             content=content,
             input_tokens=response.usage.input_tokens,
             output_tokens=response.usage.output_tokens,
+            cache_creation_tokens=created,
+            cache_read_tokens=read,
         )
 
+    async def complete_stream(
+        self,
+        messages: list[Message],
+        system: str | list = "",
+        model_tier: str = "balanced",
+        max_tokens: int = 4096,
+        temperature: float | None = None,
+    ):
+        """Yield response text as it is generated.
+
+        Breaking out of the iteration closes the underlying HTTP stream,
+        cancelling the rest of the generation server-side.
+        """
+        kwargs: dict[str, Any] = {
+            "model":      self._get_model(model_tier),
+            "max_tokens": max_tokens,
+            "messages":   self._to_anthropic_messages(messages),
+        }
+        if system:
+            kwargs["system"] = system
+        if temperature is not None:
+            kwargs["temperature"] = temperature
+
+        async with self.client.messages.stream(**kwargs) as stream:
+            async for text in stream.text_stream:
+                yield text
+
     async def complete_with_tools(
         self,
         messages: list[Message],
         tools: list[dict[str, Any]],
-        system: str = "",
+        system: str | list = "",
         model_tier: str = "balanced",
         max_tokens: int = 4096,
         temperature: float | None = None,
@@ -90,9 +150,12 @@ class ClaudeProvider(LLMProvider):
                     "input": block.input,
                 })
 
+        created, read = self._cache_usage(response.usage)
         return LLMResponse(
             content=content,
             tool_calls=tool_calls,
             input_tokens=response.usage.input_tokens,
             output_tokens=response.usage.output_tokens,
+            cache_creation_tokens=created,
+            cache_read_tokens=read,
         )
@@ -1,17 +1,31 @@
 ﻿import traceback
 import sys
 import logging
+from contextvars import ContextVar
 from pathlib import Path
 from datetime import datetime
 from config.settings import settings
 
+# Current task id, set by CoreLoop.run around each task. The filter below
+# injects it into every record, so call sites no longer interpolate
+# f"[{task_id}] ..." prefixes eagerly.
+task_id_var: ContextVar[str] = ContextVar("task_id", default="-")
+
+
+class TaskIdFilter(logging.Filter):
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.task_id = task_id_var.get()
+        return True
+
+
 # Настраиваем стандартный logging
 log_dir = Path(settings.log_dir)
 log_dir.mkdir(parents=True, exist_ok=True)
 
 logging.basicConfig(
     level=getattr(logging, settings.log_level.upper(), logging.INFO),
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    format="%(asctime)s [%(levelname)s] %(name)s [%(task_id)s]: %(message)s",
     handlers=[
         logging.FileHandler(
             log_dir / f"errors-{datetime.now().strftime('%Y-%m-%d')}.log",
@@ -21,6 +35,9 @@ logging.basicConfig(
     ]
 )
 
+for _handler in logging.getLogger().handlers:
+    _handler.addFilter(TaskIdFilter())
+
 
 def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
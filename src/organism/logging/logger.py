@@ -5,18 +5,60 @@ from pathlib import Path
 from src.organism.utils.timezone import now_local
 from config.settings import settings
 
+try:
+    import orjson  # optional: ~5x faster dumps for the per-step log records
+except ImportError:
+    orjson = None
+
 
 class Logger:
 
+    # Records buffered in the file handle before a forced flush; the
+    # handle's own 1MB buffer batches write() syscalls in between.
+    _FLUSH_EVERY = 16
+
     def __init__(self) -> None:
         self.log_dir = Path(settings.log_dir)
         self.log_dir.mkdir(parents=True, exist_ok=True)
+        self._fh = None
+        self._fh_day = ""
+        self._pending = 0
+
+    def _ensure_handle(self, today: str):
+        """Keep one appending handle per day instead of open/close per event."""
+        if self._fh is None or self._fh_day != today:
+            if self._fh is not None:
+                try:
+                    self._fh.close()
+                except Exception:
+                    pass
+            self._fh = open(
+                self.log_dir / f"{today}.jsonl", "a",
+                encoding="utf-8", buffering=1 << 20,
+            )
+            self._fh_day = today
+        return self._fh
 
     def _log(self, event: dict) -> None:
         today = now_local().strftime("%Y-%m-%d")
-        log_file = self.log_dir / f"{today}.jsonl"
-        with open(log_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(event, ensure_ascii=False) + "\n")
+        fh = self._ensure_handle(today)
+        if orjson is not None:
+            line = orjson.dumps(event).decode()
+        else:
+            line = json.dumps(event, ensure_ascii=False)
+        fh.write(line + "\n")
+        self._pending += 1
+        if self._pending >= self._FLUSH_EVERY:
+            self.flush()
+
+    def flush(self) -> None:
+        """Push buffered records to disk (CoreLoop calls this at task end)."""
+        self._pending = 0
+        if self._fh is not None:
+            try:
+                self._fh.flush()
+            except Exception:
+                pass
 
     def log_task_start(self, task_id: str, task: str) -> None:
         self._log({
@@ -646,6 +646,26 @@ async def _m016_artel_id_remaining(conn) -> None:
         except Exception:
             pass
 
+async def _m017_hnsw_embedding_index(conn) -> None:
+    """ANN index for search_similar's vector scan.
+
+    Without it pgvector does a sequential scan over every embedding
+    (O(n) at 1536 dims); HNSW makes the top-K lookup logarithmic.
+    L2 opclass matches the `<->` operator used in search_similar.
+    Requires pgvector >= 0.5 — on older installs the CREATE fails and
+    is skipped (seq scan keeps working, just slower).
+    """
+    try:
+        await conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_tm_embedding_hnsw "
+            "ON task_memories USING hnsw (embedding vector_l2_ops) "
+            "WITH (m = 16, ef_construction = 64)"
+        ))
+    except Exception:
+        pass
+    # Metadata prefilter (success, quality, date) is already covered by
+    # ix_tm_search from _m001 — no extra fallback index needed.
+
 
 # Migration registry -- (version, name, function)
 # APPEND ONLY -- never remove or reorder entries
@@ -666,4 +686,5 @@ _MIGRATIONS = [
     (14, "scheduled_jobs_requires_approval", _m014_scheduled_jobs_requires_approval),
     (15, "pending_publications", _m015_pending_publications),
     (16, "artel_id_remaining", _m016_artel_id_remaining),
+    (17, "hnsw_embedding_index", _m017_hnsw_embedding_index),
 ]
@@ -1,9 +1,16 @@
 import openai
 from config.settings import settings
+from src.organism.llm.cache import get_llm_cache
 from src.organism.logging.error_handler import get_logger
 
 _log = get_logger("memory.embeddings")
 
+# The same task text gets embedded by several consumers within one request
+# (memory lookup, semantic plan cache) — memoize recent vectors so each
+# distinct text hits the API once. FIFO-bounded; failures are not cached.
+_CACHE_MAX = 256
+_cache: dict[str, list[float]] = {}
+
 # PERF-2: Lazy singleton — avoid creating client on every call
 _client: openai.AsyncOpenAI | None = None
 _client_key: str | None = None  # tracks (api_key, base_url) to detect config changes
@@ -49,12 +56,66 @@ async def get_embedding(text: str) -> list[float]:
 
     text = text[:2000]
 
+    cached = _cache.get(text)
+    if cached is not None:
+        return cached
+
+    # Persistent layer (dev/benchmark: survives restarts, ORGANISM_CACHE_DIR)
+    disk = get_llm_cache()
+    disk_key = None
+    if disk is not None:
+        disk_key = disk.make_key("emb", text)
+        stored = disk.get(disk_key)
+        if isinstance(stored, list) and stored:
+            if len(_cache) >= _CACHE_MAX:
+                _cache.pop(next(iter(_cache)))
+            _cache[text] = stored
+            return stored
+
     try:
         response = await client.embeddings.create(
             model="text-embedding-3-small",
             input=text,
         )
-        return response.data[0].embedding
     except Exception as e:
         _log.warning(f"Embedding failed: {e}")
         return []
+
+    vector = response.data[0].embedding
+    if len(_cache) >= _CACHE_MAX:
+        _cache.pop(next(iter(_cache)))
+    _cache[text] = vector
+    if disk_key is not None:
+        disk.put(disk_key, vector)
+    return vector
+
+
+async def get_embeddings(texts: list[str]) -> list[list[float]]:
+    """Batch variant of get_embedding — one API call for many texts.
+
+    Cached entries are served locally and only misses go to the API
+    (up to 2048 inputs per request). Returns one vector per input;
+    empty lists on failure, matching get_embedding's contract.
+    """
+    client = _get_client()
+    if client is None:
+        return [[] for _ in texts]
+
+    texts = [t[:2000] for t in texts]
+    vectors: list[list[float] | None] = [_cache.get(t) for t in texts]
+    missing = [i for i, v in enumerate(vectors) if v is None]
+    if missing:
+        try:
+            response = await client.embeddings.create(
+                model="text-embedding-3-small",
+                input=[texts[i] for i in missing],
+            )
+        except Exception as e:
+            _log.warning(f"Batch embedding failed: {e}")
+            return [v if v is not None else [] for v in vectors]
+        for i, item in zip(missing, response.data):
+            if len(_cache) >= _CACHE_MAX:
+                _cache.pop(next(iter(_cache)))
+            _cache[texts[i]] = item.embedding
+            vectors[i] = item.embedding
+    return [v if v is not None else [] for v in vectors]
@@ -4,7 +4,7 @@ from datetime import datetime, timedelta
 from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from .database import TaskMemory, UserProfile, AsyncSessionLocal
-from .embeddings import get_embedding
+from .embeddings import get_embedding, get_embeddings
 from src.organism.llm.base import LLMProvider, Message
 from src.organism.utils.timezone import to_local
 from config.settings import settings
@@ -90,6 +90,58 @@ class LongTermMemory:
 
         return memory_id
 
+    async def save_tasks_bulk(self, records: list[dict]) -> list[str]:
+        """Save many task memories: one batched embedding call, one commit.
+
+        Each record carries the save_task keyword arguments. For
+        backfills and re-index sweeps, where one API call and one
+        INSERT per row would dominate the runtime.
+        """
+        if not records:
+            return []
+
+        enriched = [
+            _enrich_for_embedding(
+                task=r["task"],
+                tools_used=r.get("tools_used") or [],
+                outcome=(r.get("result") or "")[:200] if r.get("success") else None,
+            )
+            for r in records
+        ]
+        embeddings = await get_embeddings(enriched)
+
+        memory_ids: list[str] = []
+        rows = []
+        for r, embedding in zip(records, embeddings):
+            memory_id = uuid.uuid4().hex
+            memory_ids.append(memory_id)
+            rows.append(TaskMemory(
+                id=memory_id,
+                task=r["task"],
+                result=(r.get("result") or "")[:10000],
+                success=bool(r.get("success")),
+                duration=r.get("duration", 0.0),
+                steps_count=r.get("steps_count", 0),
+                tools_used=",".join(r.get("tools_used") or []),
+                quality_score=r.get("quality_score", 0.0),
+                embedding=embedding if embedding else None,
+            ))
+
+        async with AsyncSessionLocal() as session:
+            session.add_all(rows)
+            await session.commit()
+            # Q-9.6: Set artel_id on newly created rows
+            try:
+                await session.execute(
+                    text("UPDATE task_memories SET artel_id = :aid WHERE id = ANY(:mids)"),
+                    {"aid": settings.artel_id, "mids": memory_ids},
+                )
+                await session.commit()
+            except Exception:
+                pass
+
+        return memory_ids
+
     # text-embedding-3-small: L2=sqrt(2*(1-cosine)), threshold 1.0 ~ cosine>=0.5
     SIMILARITY_THRESHOLD = 1.0
 
@@ -170,6 +222,15 @@ class LongTermMemory:
             fetch = limit * 2
 
             # --- Vector search (pgvector L2 distance) ---
+            # HNSW tuning (migration 17): ef_search=40 is plenty for top-6
+            # recall. Run under a savepoint: on pgvector builds without the
+            # GUC the statement fails, and without the savepoint that would
+            # abort the whole transaction and break the SELECT below.
+            try:
+                async with session.begin_nested():
+                    await session.execute(text("SET LOCAL hnsw.ef_search = 40"))
+            except Exception:
+                pass
             _artel = settings.artel_id
             dist_expr = TaskMemory.embedding.l2_distance(embedding)
             vec_stmt = (
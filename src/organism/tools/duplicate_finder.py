@@ -118,7 +118,7 @@ class DuplicateFinderTool(BaseTool):
 
         # 2. Pairwise cosine similarity
         names = [e[0] for e in embeddings]
-        vectors = np.array([e[1] for e in embeddings])
+        vectors = np.array([e[1] for e in embeddings], dtype=np.float32)
 
         # Normalize for cosine similarity
         norms = np.linalg.norm(vectors, axis=1, keepdims=True)
@@ -128,13 +128,16 @@ class DuplicateFinderTool(BaseTool):
         # Cosine similarity matrix
         sim_matrix = normalized @ normalized.T
 
-        # 3. Find pairs above threshold (exclude self-pairs)
-        pairs: list[tuple[int, int, float]] = []
+        # 3. Find pairs above threshold (exclude self-pairs) — vectorized
+        # over the upper triangle instead of a Python O(n^2) scan
         n = len(names)
-        for i in range(n):
-            for j in range(i + 1, n):
-                if sim_matrix[i, j] >= threshold:
-                    pairs.append((i, j, float(sim_matrix[i, j])))
+        iu, ju = np.triu_indices(n, k=1)
+        upper = sim_matrix[iu, ju]
+        mask = upper >= threshold
+        pairs: list[tuple[int, int, float]] = [
+            (int(i), int(j), float(s))
+            for i, j, s in zip(iu[mask], ju[mask], upper[mask])
+        ]
 
         if not pairs:
             return []
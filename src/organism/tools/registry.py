@@ -8,11 +8,14 @@ class ToolRegistry:
     def __init__(self) -> None:
         self._tools: dict[str, BaseTool] = {}
         self._mcp_clients: dict[str, MCPClient] = {}  # name -> client
+        # Built once per registry mutation, not once per task
+        self._schema_cache: list[dict[str, Any]] | None = None
 
     def register(self, tool: BaseTool) -> None:
         if tool.name in self._tools:
             raise ValueError(f"Tool '{tool.name}' is already registered")
         self._tools[tool.name] = tool
+        self._schema_cache = None
 
     def get(self, name: str) -> BaseTool:
         if name not in self._tools:
@@ -23,8 +26,10 @@ class ToolRegistry:
         return list(self._tools.keys())
 
     def to_json_schema(self) -> list[dict[str, Any]]:
-        """Return all tools formatted for Claude API."""
-        return [tool.to_json_schema() for tool in self._tools.values()]
+        """Return all tools formatted for Claude API (cached until mutation)."""
+        if self._schema_cache is None:
+            self._schema_cache = [tool.to_json_schema() for tool in self._tools.values()]
+        return self._schema_cache
 
     # ── MCP server management (Q-8.1) ────────────────────────────────────
 
@@ -57,6 +62,8 @@ class ToolRegistry:
             except Exception:
                 pass
 
+        if registered:
+            self._schema_cache = None
         return registered
 
     def unregister_mcp_server(self, server_name: str) -> int:
@@ -69,6 +76,8 @@ class ToolRegistry:
         for name in to_remove:
             del self._tools[name]
         self._mcp_clients.pop(server_name, None)
+        if to_remove:
+            self._schema_cache = None
         return len(to_remove)
 
     def list_mcp_servers(self) -> list[str]:
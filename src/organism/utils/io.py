@@ -0,0 +1,28 @@
+"""Async wrappers for blocking filesystem calls used inside coroutines.
+
+Temp-file creation and unlink are synchronous disk operations; calling
+them directly in aiogram handlers stalls the whole dispatcher while the
+disk works. These helpers push them to the default thread pool.
+"""
+import asyncio
+import os
+import tempfile
+
+
+def _make_temp(suffix: str) -> str:
+    tmp = tempfile.NamedTemporaryFile(suffix=suffix, delete=False)
+    tmp.close()
+    return tmp.name
+
+
+async def make_temp_file(suffix: str = "") -> str:
+    """Create a closed NamedTemporaryFile off-loop and return its path."""
+    return await asyncio.to_thread(_make_temp, suffix)
+
+
+async def remove_file(path: str) -> None:
+    """Unlink off-loop; errors (already gone, permissions) are ignored."""
+    try:
+        await asyncio.to_thread(os.unlink, path)
+    except Exception:
+        pass